@@ -0,0 +1,71 @@
+from collections import OrderedDict
+from typing import Callable, Hashable, Optional, Tuple
+
+from sympy import Symbol, diff, lambdify
+
+# "math" gives scalar functions, the functions absent from math are taken from mpmath and sympy.
+MODULES = {"math": ["math", "mpmath", "sympy"], "numpy": "numpy"}
+
+
+class CompiledFunctionCache:
+    """
+    LRU cache of the sympy expressions compiled by lambdify and of their derivatives.
+    The key is (expression or its source string, variable, module, derivative order).
+    The derivative expressions are cached with module None.
+    """
+
+    def __init__(self, max_size: int = 256):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._items: "OrderedDict[Tuple[Hashable, str, Optional[str], int], object]" = OrderedDict()
+
+    def __len__(self):
+        return len(self._items)
+
+    def clear(self):
+        self._items.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def get_function(
+        self, expression, variable: str = "x", module: str = "numpy", derivative_order: int = 0
+    ) -> Callable:
+        key = (expression, variable, module, derivative_order)
+        function = self._get(key)
+        if function is None:
+            derivative = self.get_derivative(expression, variable, derivative_order)
+            function = self._put(key, lambdify(variable, derivative, MODULES[module]))
+        return function
+
+    def get_derivative(self, expression, variable: str = "x", derivative_order: int = 1):
+        if derivative_order == 0:
+            return expression
+        key = (expression, variable, None, derivative_order)
+        derivative = self._get(key)
+        if derivative is None:
+            previous_derivative = self.get_derivative(expression, variable, derivative_order - 1)
+            derivative = self._put(key, diff(previous_derivative, Symbol(variable)))
+        return derivative
+
+    def _get(self, key):
+        item = self._items.get(key)
+        if item is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self._items.move_to_end(key)
+        return item
+
+    def _put(self, key, item):
+        self._items[key] = item
+        if len(self._items) > self.max_size:
+            self._items.popitem(last=False)
+        return item
+
+
+compiled_function_cache = CompiledFunctionCache()
+
+
+def get_compiled_function(expression, variable: str = "x", module: str = "numpy", derivative_order: int = 0):
+    return compiled_function_cache.get_function(expression, variable, module, derivative_order)
@@ -1,5 +1,10 @@
 from abc import ABC, abstractmethod
-from typing import List
+from itertools import chain, islice
+from typing import Iterable, Iterator, List
+
+import numpy as np
+
+from common.calculation.derivative.fornberg import get_fornberg_weights
 
 
 class DerivativeCalculator(ABC):
@@ -8,41 +13,151 @@ class DerivativeCalculator(ABC):
         pass
 
 
-class FirstDerivativeCalculator(DerivativeCalculator):
-    @staticmethod
-    def _calculate_central_derivative(left_value, right_value, inter_node_length):
-        return (right_value - left_value) / (2 * inter_node_length)
+class FiniteDifferenceCalculator(DerivativeCalculator):
+    """
+    The derivative of the given order on an equidistant grid with the error O(h^accuracy_order).
+    The inner nodes get the central stencil of 2r + 1 nodes, it is applied to all of them at once as a sum
+    of the shifted slices. The r nodes at each end get the one-sided stencils of derivative_order + accuracy_order
+    nodes, or they are left out if with_boundaries is False. The values are taken along the last axis.
+    The weights are computed by Fornberg's algorithm once for the unit step.
+    """
+
+    def __init__(self, derivative_order: int = 1, accuracy_order: int = 2, with_boundaries: bool = True):
+        if derivative_order < 1 or accuracy_order < 1:
+            raise ValueError("The derivative and accuracy orders must be positive.")
+        self.derivative_order = derivative_order
+        self.accuracy_order = accuracy_order
+        self.with_boundaries = with_boundaries
+
+        # The central stencil has the accuracy order rounded up to even.
+        self.radius = (derivative_order + 1) // 2 + (accuracy_order + 1) // 2 - 1
+        offsets = np.arange(-self.radius, self.radius + 1)
+        self.central_weights = get_fornberg_weights(0.0, offsets, derivative_order)[derivative_order]
+
+        self.boundary_width = max(derivative_order + accuracy_order, 2 * self.radius + 1)
+        positions = np.arange(self.radius)
+        boundary_nodes = np.broadcast_to(np.arange(self.boundary_width), (self.radius, self.boundary_width))
+        # The i-th row gives the derivative at the node i from the first boundary_width nodes.
+        self.left_weights = get_fornberg_weights(positions, boundary_nodes, derivative_order)[:, derivative_order]
+        # At the right end the stencils are the mirrored left ones, the odd derivatives change the sign.
+        self.right_weights = (-1) ** derivative_order * self.left_weights[::-1, ::-1]
+
+    def calculate(self, function_values, inter_node_length) -> np.ndarray:
+        values = np.asarray(function_values, dtype=float)
+        number_of_values = values.shape[-1]
+        if number_of_values < self._get_min_number_of_values():
+            raise ValueError("Too few function values.")
+
+        scale = inter_node_length ** self.derivative_order
+        central_derivatives = self._apply_central_stencil(values) / scale
+        if not self.with_boundaries:
+            return central_derivatives
+
+        derivatives = np.empty(values.shape)
+        derivatives[..., self.radius : number_of_values - self.radius] = central_derivatives
+        derivatives[..., : self.radius] = self._get_left_derivatives(values, scale)
+        derivatives[..., number_of_values - self.radius :] = self._get_right_derivatives(values, scale)
+        return derivatives
+
+    def calculate_in_chunks(
+        self, function_values: Iterable, inter_node_length, chunk_size: int = 2 ** 16
+    ) -> Iterator[np.ndarray]:
+        """
+        The same derivatives for the samples that don't fit into memory. function_values is an array, e.g. np.memmap,
+        or an iterable of single samples, both are read by chunk_size samples, or an iterable of chunks. The last 2r
+        samples are carried over to the next chunk, and the derivatives of the nodes whose stencils are complete are
+        yielded, so the memory is O(chunk). The values are the same as calculate gives for the whole array.
+        """
+
+        if isinstance(function_values, np.ndarray):
+            chunks = (function_values[i : i + chunk_size] for i in range(0, len(function_values), chunk_size))
+        else:
+            chunks = self._get_chunks(iter(function_values), chunk_size)
+        scale = inter_node_length ** self.derivative_order
+        halo = np.empty(0)
+        tail = np.empty(0)
+        number_of_values = 0
+        # The left derivatives need the first boundary_width samples, they are gathered before anything is yielded.
+        is_beginning = self.with_boundaries
+
+        for chunk in chunks:
+            chunk = np.asarray(chunk, dtype=float)
+            number_of_values += chunk.size
+            samples = np.concatenate((halo, chunk))
+            tail = np.concatenate((tail, chunk[-self.boundary_width :]))[-self.boundary_width :]
+            if (is_beginning and samples.size < self.boundary_width) or samples.size < 2 * self.radius + 1:
+                halo = samples
+                continue
+
+            central_derivatives = self._apply_central_stencil(samples) / scale
+            if is_beginning:
+                central_derivatives = np.concatenate((self._get_left_derivatives(samples, scale), central_derivatives))
+                is_beginning = False
+            halo = samples[samples.size - 2 * self.radius :]
+            yield central_derivatives
+
+        if number_of_values < self._get_min_number_of_values():
+            raise ValueError("Too few function values.")
+        if self.with_boundaries:
+            yield self._get_right_derivatives(tail, scale)
 
     @staticmethod
-    def _calculate_left_derivative(left_value, central_value, right_value, inter_node_length):
-        return (-3 * left_value + 4 * central_value - right_value) / (2 * inter_node_length)
+    def _get_chunks(iterator: Iterator, chunk_size: int) -> Iterator[np.ndarray]:
+        """The chunks are passed as they are, the single samples are gathered into the chunks of chunk_size."""
+
+        first_item = next(iterator, None)
+        if first_item is None:
+            return
+        if np.ndim(first_item) > 0:
+            yield from chain([first_item], iterator)
+            return
+
+        iterator = chain([first_item], iterator)
+        while True:
+            chunk = np.fromiter(islice(iterator, chunk_size), dtype=float)
+            if chunk.size == 0:
+                return
+            yield chunk
+
+    def _get_min_number_of_values(self) -> int:
+        return self.boundary_width if self.with_boundaries else 2 * self.radius + 1
+
+    def _apply_central_stencil(self, values: np.ndarray) -> np.ndarray:
+        number_of_derivatives = values.shape[-1] - 2 * self.radius
+        result = self.central_weights[0] * values[..., :number_of_derivatives]
+        for j in range(1, 2 * self.radius + 1):
+            result = result + self.central_weights[j] * values[..., j : j + number_of_derivatives]
+        return result
 
     @staticmethod
-    def _calculate_right_derivative(left_value, central_value, right_value, inter_node_length):
-        return (3 * right_value - 4 * central_value + left_value) / (2 * inter_node_length)
+    def _apply_boundary_stencils(values: np.ndarray, weights: np.ndarray) -> np.ndarray:
+        result = values[..., 0, np.newaxis] * weights[:, 0]
+        for j in range(1, weights.shape[1]):
+            result = result + values[..., j, np.newaxis] * weights[:, j]
+        return result
+
+    def _get_left_derivatives(self, values: np.ndarray, scale) -> np.ndarray:
+        return self._apply_boundary_stencils(values[..., : self.boundary_width], self.left_weights) / scale
+
+    def _get_right_derivatives(self, values: np.ndarray, scale) -> np.ndarray:
+        number_of_values = values.shape[-1]
+        right_values = values[..., number_of_values - self.boundary_width :]
+        return self._apply_boundary_stencils(right_values, self.right_weights) / scale
+
+
+class FirstDerivativeCalculator(FiniteDifferenceCalculator):
+    def __init__(self):
+        super().__init__(derivative_order=1, accuracy_order=2)
 
     def calculate(self, function_values, inter_node_length) -> List[float]:
-        if len(function_values) < 3:
-            raise ValueError("Too few function values.")
-        return [
-            self._calculate_left_derivative(*function_values[:3], inter_node_length),
-            *[
-                self._calculate_central_derivative(function_values[i - 1], function_values[i + 1], inter_node_length)
-                for i in range(1, len(function_values) - 1)
-            ],
-            self._calculate_right_derivative(*function_values[-3:], inter_node_length),
-        ]
+        return super().calculate(function_values, inter_node_length).tolist()
 
 
-class SecondDerivativeCalculator(DerivativeCalculator):
-    @staticmethod
-    def _calculate_central_derivative(left_value, central_value, right_value, inter_node_length):
-        return (left_value - 2 * central_value + right_value) / (inter_node_length ** 2)
+class SecondDerivativeCalculator(FiniteDifferenceCalculator):
+    """Only the inner nodes get a value."""
+
+    def __init__(self):
+        super().__init__(derivative_order=2, accuracy_order=2, with_boundaries=False)
 
     def calculate(self, function_values, inter_node_length) -> List[float]:
-        if len(function_values) < 3:
-            raise ValueError("Too few function values.")
-        return [
-            self._calculate_central_derivative(*function_values[i - 1 : i + 2], inter_node_length)
-            for i in range(1, len(function_values) - 1)
-        ]
+        return super().calculate(function_values, inter_node_length).tolist()
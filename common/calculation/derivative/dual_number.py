@@ -0,0 +1,198 @@
+from sys import float_info
+from typing import Callable, Tuple
+
+import numpy as np
+from sympy.core.assumptions import ManagedProperties
+
+from common.calculation.compiled_functions import get_compiled_function
+
+# f(a + b e) = f(a) + f'(a) b e, so each function needs its derivative.
+_UNARY_DERIVATIVES = {
+    np.negative: lambda x: -1.0,
+    np.positive: lambda x: 1.0,
+    np.absolute: np.sign,
+    np.square: lambda x: 2 * x,
+    np.sqrt: lambda x: 0.5 / np.sqrt(x),
+    np.cbrt: lambda x: 1 / (3 * np.cbrt(x) ** 2),
+    np.exp: np.exp,
+    np.exp2: lambda x: np.log(2) * np.exp2(x),
+    np.expm1: np.exp,
+    np.log: lambda x: 1 / x,
+    np.log2: lambda x: 1 / (x * np.log(2)),
+    np.log10: lambda x: 1 / (x * np.log(10)),
+    np.log1p: lambda x: 1 / (1 + x),
+    np.sin: np.cos,
+    np.cos: lambda x: -np.sin(x),
+    np.tan: lambda x: 1 / np.cos(x) ** 2,
+    np.arcsin: lambda x: 1 / np.sqrt(1 - x ** 2),
+    np.arccos: lambda x: -1 / np.sqrt(1 - x ** 2),
+    np.arctan: lambda x: 1 / (1 + x ** 2),
+    np.sinh: np.cosh,
+    np.cosh: np.sinh,
+    np.tanh: lambda x: 1 / np.cosh(x) ** 2,
+    np.arcsinh: lambda x: 1 / np.sqrt(x ** 2 + 1),
+    np.arccosh: lambda x: 1 / np.sqrt(x ** 2 - 1),
+    np.arctanh: lambda x: 1 / (1 - x ** 2),
+}
+
+_BINARY_OPERATORS = {
+    np.add: lambda x, y: x + y,
+    np.subtract: lambda x, y: x - y,
+    np.multiply: lambda x, y: x * y,
+    np.true_divide: lambda x, y: x / y,
+    np.power: lambda x, y: x ** y,
+}
+
+
+class DualNumber:
+    """
+    a + b e with e^2 = 0. A function of DualNumber(x, 1) gives DualNumber(f(x), f'(x)), so the value and the derivative
+    are computed together in one pass. The arithmetic operators and the NumPy functions are supported,
+    the functions of math convert the argument to float and raise TypeError.
+    """
+
+    __slots__ = ("value", "derivative")
+    __hash__ = None
+
+    def __init__(self, value, derivative=0.0):
+        self.value = value
+        self.derivative = derivative
+
+    def __repr__(self):
+        return f"DualNumber({self.value!r}, {self.derivative!r})"
+
+    def __add__(self, other):
+        if isinstance(other, DualNumber):
+            return DualNumber(self.value + other.value, self.derivative + other.derivative)
+        return DualNumber(self.value + other, self.derivative)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if isinstance(other, DualNumber):
+            return DualNumber(self.value - other.value, self.derivative - other.derivative)
+        return DualNumber(self.value - other, self.derivative)
+
+    def __rsub__(self, other):
+        return DualNumber(other - self.value, -self.derivative)
+
+    def __mul__(self, other):
+        if isinstance(other, DualNumber):
+            return DualNumber(self.value * other.value, self.derivative * other.value + self.value * other.derivative)
+        return DualNumber(self.value * other, self.derivative * other)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if isinstance(other, DualNumber):
+            return DualNumber(
+                self.value / other.value,
+                (self.derivative * other.value - self.value * other.derivative) / other.value ** 2,
+            )
+        return DualNumber(self.value / other, self.derivative / other)
+
+    def __rtruediv__(self, other):
+        return DualNumber(other / self.value, -other * self.derivative / self.value ** 2)
+
+    def __pow__(self, other):
+        if isinstance(other, DualNumber):
+            value = self.value ** other.value
+            return DualNumber(
+                value,
+                value * (other.derivative * np.log(self.value) + other.value * self.derivative / self.value),
+            )
+        if other == 0:
+            return DualNumber(self.value ** 0, self.derivative * 0.0)
+        return DualNumber(self.value ** other, other * self.value ** (other - 1) * self.derivative)
+
+    def __rpow__(self, other):
+        value = other ** self.value
+        return DualNumber(value, value * np.log(other) * self.derivative)
+
+    def __neg__(self):
+        return DualNumber(-self.value, -self.derivative)
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        return DualNumber(abs(self.value), np.sign(self.value) * self.derivative)
+
+    # The comparisons are by the value, so that the branches of the function are taken as for a number.
+    def __eq__(self, other):
+        return self.value == (other.value if isinstance(other, DualNumber) else other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __lt__(self, other):
+        return self.value < (other.value if isinstance(other, DualNumber) else other)
+
+    def __le__(self, other):
+        return self.value <= (other.value if isinstance(other, DualNumber) else other)
+
+    def __gt__(self, other):
+        return self.value > (other.value if isinstance(other, DualNumber) else other)
+
+    def __ge__(self, other):
+        return self.value >= (other.value if isinstance(other, DualNumber) else other)
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        if method != "__call__" or kwargs:
+            return NotImplemented
+        if len(inputs) == 1 and ufunc in _UNARY_DERIVATIVES:
+            return DualNumber(ufunc(self.value), _UNARY_DERIVATIVES[ufunc](self.value) * self.derivative)
+        if len(inputs) == 2 and ufunc in _BINARY_OPERATORS:
+            # The numbers are lifted, otherwise a NumPy scalar would pass the operation back here.
+            left, right = (x if isinstance(x, DualNumber) else DualNumber(x) for x in inputs)
+            return _BINARY_OPERATORS[ufunc](left, right)
+        return NotImplemented
+
+
+def get_value_and_derivative(function: Callable, x: float) -> Tuple[float, float]:
+    result = function(DualNumber(x, 1.0))
+    if isinstance(result, DualNumber):
+        return float(result.value), float(result.derivative)
+    # The function doesn't depend on x.
+    return float(result), 0.0
+
+
+class ValueAndDerivativeFunction:
+    """
+    Gives f(x) and f'(x) together. A sympy expression is differentiated symbolically, an object with
+    the value_and_derivative method, e.g. an interpolation polynomial, is asked for both, another callable gets
+    dual numbers. If the callable can't take them, e.g. it uses the functions of math or converts its argument
+    to float, the derivative is found by the central difference.
+    """
+
+    def __init__(self, function, variable: str = "x"):
+        self.function = function
+        self._is_symbolic = isinstance(type(function), ManagedProperties)
+        if self._is_symbolic:
+            self._func_as_lambda = get_compiled_function(function, variable)
+            self._derivative_as_lambda = get_compiled_function(function, variable, derivative_order=1)
+        self._value_and_derivative = getattr(function, "value_and_derivative", None)
+        self._takes_dual_numbers = None
+
+    def __call__(self, x: float) -> Tuple[float, float]:
+        if self._is_symbolic:
+            return self._func_as_lambda(x), self._derivative_as_lambda(x)
+        if self._value_and_derivative is not None:
+            return self._value_and_derivative(x)
+        if self._takes_dual_numbers is None:
+            try:
+                value_and_derivative = get_value_and_derivative(self.function, x)
+            except (TypeError, ValueError):
+                self._takes_dual_numbers = False
+            else:
+                self._takes_dual_numbers = True
+                return value_and_derivative
+        if self._takes_dual_numbers:
+            return get_value_and_derivative(self.function, x)
+        return self._get_central_difference(x)
+
+    def _get_central_difference(self, x: float) -> Tuple[float, float]:
+        step = float_info.epsilon ** (1 / 3) * max(1.0, abs(x))
+        value = float(self.function(x))
+        right_value, left_value = float(self.function(x + step)), float(self.function(x - step))
+        return value, (right_value - left_value) / (2 * step)
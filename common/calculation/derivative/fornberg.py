@@ -0,0 +1,40 @@
+import numpy as np
+
+
+def get_fornberg_weights(point, nodes, max_derivative_order: int) -> np.ndarray:
+    """
+    Fornberg's algorithm. Returns the weights c[..., k, j], so that f^{(k)}(point) ≈ sum_j c[..., k, j] f(nodes[..., j])
+    for k = 0, ..., max_derivative_order. The nodes are taken along the last axis, any leading axes are the separate
+    stencils, computed all at once. The point has the shape of the leading axes.
+    """
+
+    nodes = np.asarray(nodes, dtype=float)
+    point = np.asarray(point, dtype=float)
+    number_of_nodes = nodes.shape[-1]
+    if number_of_nodes <= max_derivative_order:
+        raise ValueError("Too few nodes for the derivative order.")
+
+    weights = np.zeros(nodes.shape[:-1] + (max_derivative_order + 1, number_of_nodes))
+    weights[..., 0, 0] = 1.0
+    previous_product = np.ones(nodes.shape[:-1])
+    previous_shift = nodes[..., 0] - point
+    for i in range(1, number_of_nodes):
+        max_order = min(i, max_derivative_order)
+        product = np.ones(nodes.shape[:-1])
+        shift = nodes[..., i] - point
+        for j in range(i):
+            difference = nodes[..., i] - nodes[..., j]
+            product = product * difference
+            if j == i - 1:
+                for k in range(max_order, 0, -1):
+                    weights[..., k, i] = (
+                        previous_product
+                        * (k * weights[..., k - 1, i - 1] - previous_shift * weights[..., k, i - 1])
+                        / product
+                    )
+                weights[..., 0, i] = -previous_product * previous_shift * weights[..., 0, i - 1] / product
+            for k in range(max_order, 0, -1):
+                weights[..., k, j] = (shift * weights[..., k, j] - k * weights[..., k - 1, j]) / difference
+            weights[..., 0, j] = shift * weights[..., 0, j] / difference
+        previous_product, previous_shift = product, shift
+    return weights
@@ -0,0 +1,72 @@
+from collections import OrderedDict
+from typing import Tuple
+
+import numpy as np
+
+from common.calculation.derivative.fornberg import get_fornberg_weights
+
+
+class NonUniformDerivativeCalculator:
+    """
+    The derivative of the given order on an arbitrary increasing grid with the error O(h^accuracy_order).
+    Each node gets the stencil of derivative_order + accuracy_order consecutive nodes, centered as far as the ends
+    allow, and its weights are computed by Fornberg's algorithm for all the nodes at once.
+    The stencils of the last max_number_of_grids grids are kept, so the repeated differentiation on the same grid
+    costs one banded product, O(N * stencil width).
+    """
+
+    def __init__(self, derivative_order: int = 1, accuracy_order: int = 2, max_number_of_grids: int = 16):
+        if derivative_order < 1 or accuracy_order < 1:
+            raise ValueError("The derivative and accuracy orders must be positive.")
+        self.derivative_order = derivative_order
+        self.accuracy_order = accuracy_order
+        self.stencil_width = derivative_order + accuracy_order
+        self.max_number_of_grids = max_number_of_grids
+        self._stencils: "OrderedDict[bytes, Tuple[np.ndarray, np.ndarray]]" = OrderedDict()
+
+    def calculate(self, function_values, nodes) -> np.ndarray:
+        """The values are taken along the last axis, one per node."""
+
+        values = np.asarray(function_values, dtype=float)
+        starts, weights = self._get_stencils(np.asarray(nodes, dtype=float))
+        if values.shape[-1] != starts.size:
+            raise ValueError("The number of function values must be equal to the number of nodes.")
+
+        # The stencil of an inner node starts shift nodes before it, so the inner nodes are summed by slices
+        # and the end ones by indices.
+        shift = (self.stencil_width - 1) // 2
+        number_of_inner_nodes = starts.size - self.stencil_width + 1
+        inner_nodes = slice(shift, shift + number_of_inner_nodes)
+        end_nodes = np.r_[:shift, shift + number_of_inner_nodes : starts.size]
+
+        derivatives = np.empty(values.shape)
+        inner_derivatives = weights[0, inner_nodes] * values[..., :number_of_inner_nodes]
+        end_derivatives = weights[0, end_nodes] * values[..., starts[end_nodes]]
+        for j in range(1, self.stencil_width):
+            inner_derivatives += weights[j, inner_nodes] * values[..., j : j + number_of_inner_nodes]
+            end_derivatives += weights[j, end_nodes] * values[..., starts[end_nodes] + j]
+        derivatives[..., inner_nodes] = inner_derivatives
+        derivatives[..., end_nodes] = end_derivatives
+        return derivatives
+
+    def _get_stencils(self, nodes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """The first node of the stencil of each node and the weights, (N,) and (stencil_width, N)."""
+
+        key = nodes.tobytes()
+        stencils = self._stencils.get(key)
+        if stencils is not None:
+            self._stencils.move_to_end(key)
+            return stencils
+
+        if nodes.ndim != 1 or nodes.size < self.stencil_width:
+            raise ValueError("Too few nodes.")
+        if np.any(np.diff(nodes) <= 0):
+            raise ValueError("The nodes must be increasing.")
+        starts = np.clip(np.arange(nodes.size) - (self.stencil_width - 1) // 2, 0, nodes.size - self.stencil_width)
+        stencil_nodes = nodes[starts[:, np.newaxis] + np.arange(self.stencil_width)]
+        # The weights are found for the shifted nodes x_j - x_i at 0, it is the same and loses less to rounding.
+        weights = get_fornberg_weights(0.0, stencil_nodes - nodes[:, np.newaxis], self.derivative_order)
+        stencils = self._stencils[key] = (starts, np.ascontiguousarray(weights[:, self.derivative_order].T))
+        if len(self._stencils) > self.max_number_of_grids:
+            self._stencils.popitem(last=False)
+        return stencils
@@ -0,0 +1,80 @@
+from dataclasses import dataclass
+from math import inf
+from typing import Dict, Tuple
+
+from common.calculation.derivative.derivative_calculator import FiniteDifferenceCalculator
+from common.calculation.root_finding.utils import get_lambda_func
+
+
+@dataclass
+class RichardsonResult:
+    value: float
+    error_estimate: float
+    step: float
+    number_of_evaluations: int
+
+
+class RichardsonDerivativeEvaluator:
+    """
+    The derivative at one point by the central stencil of FiniteDifferenceCalculator on the steps h, h / 2, h / 4, ...
+    extrapolated to the zero step by Richardson's table. The error of the stencil is a series in h^p, h^{p+2}, ...,
+    so the m-th column removes the m-th term of it. Halving the step keeps the nodes of the previous step,
+    each function value is computed once. It stops when the estimate is within tolerance, or when the table
+    starts to diverge because of the rounding errors, and returns the value with the least error estimate.
+    The function is a callable or a sympy expression.
+    """
+
+    def __init__(
+        self,
+        derivative_order: int = 1,
+        accuracy_order: int = 2,
+        initial_step: float = 0.1,
+        max_number_of_steps: int = 20,
+        tolerance: float = 0.0,
+    ):
+        stencil = FiniteDifferenceCalculator(derivative_order, accuracy_order)
+        self.derivative_order = derivative_order
+        self.initial_step = initial_step
+        self.max_number_of_steps = max_number_of_steps
+        self.tolerance = tolerance
+        # Only the nodes with the nonzero weights are evaluated, e.g. the central one is skipped for f'.
+        self._stencil = [
+            (offset, weight)
+            for offset, weight in zip(range(-stencil.radius, stencil.radius + 1), stencil.central_weights.tolist())
+            if weight != 0
+        ]
+        self._error_order = 2 * (stencil.radius + 1 - (derivative_order + 1) // 2)
+
+    def evaluate(self, function, x: float, variable: str = "x") -> RichardsonResult:
+        func_as_lambda = get_lambda_func(function, variable, module="math")
+        # The node x + offset * initial_step / 2^level is stored as the irreducible (offset, level).
+        values: Dict[Tuple[int, int], float] = {}
+
+        def get_value(offset: int, level: int) -> float:
+            while level > 0 and offset % 2 == 0:
+                offset, level = offset // 2, level - 1
+            if (offset, level) not in values:
+                values[(offset, level)] = float(func_as_lambda(x + offset * self.initial_step / 2 ** level))
+            return values[(offset, level)]
+
+        best_result = RichardsonResult(inf, inf, self.initial_step, 0)
+        previous_row = []
+        for level in range(self.max_number_of_steps):
+            step = self.initial_step / 2 ** level
+            stencil_sum = sum(weight * get_value(offset, level) for offset, weight in self._stencil)
+            row = [stencil_sum / step ** self.derivative_order]
+            for m in range(1, level + 1):
+                factor = 2 ** (self._error_order + 2 * (m - 1))
+                row.append(row[m - 1] + (row[m - 1] - previous_row[m - 1]) / (factor - 1))
+                error_estimate = max(abs(row[m] - row[m - 1]), abs(row[m] - previous_row[m - 1]))
+                if error_estimate <= best_result.error_estimate:
+                    best_result = RichardsonResult(row[m], error_estimate, step, 0)
+
+            if best_result.error_estimate <= self.tolerance:
+                break
+            if level > 0 and abs(row[-1] - previous_row[-1]) >= 2 * best_result.error_estimate:
+                break
+            previous_row = row
+
+        best_result.number_of_evaluations = len(values)
+        return best_result
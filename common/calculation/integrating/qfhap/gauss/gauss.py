@@ -1,8 +1,7 @@
 from typing import List
 
-from common.calculation.root_finding.root_calculator import RootCalculator
-from common.calculation.root_finding.singe_solvers.as_newton_solvers.secant_solver import SecantLineSolver
-from common.calculation.root_finding.utils import get_lambda_func
+from common.calculation.root_finding.polynomial_root_finder import PolynomialRootFinder
+from common.calculation.root_finding.utils import StatisticPolicy, get_lambda_func
 from common.models.line_segment import LineSegment
 from tasks.utils.expression_parsing import custom_parse_expr
 
@@ -14,7 +13,8 @@ class GaussQF:
         self._standard_lejandr_polynomials = [1, custom_parse_expr("x")]
         self._standard_nodes = self.get_initial_standard_nodes()
         self._standard_coefficients = self.get_initial_standard_coefficients()
-        self._solver = RootCalculator(SecantLineSolver())
+        self._solver = PolynomialRootFinder()
+        self._solver.set_statistic_policy(StatisticPolicy.OFF)
         self._accuracy = accuracy
 
     def print_all(self):
@@ -40,10 +40,7 @@ class GaussQF:
     def get_nodes_in_standard_line_segment(self, nodes_count: int) -> List[float]:
         if nodes_count not in self._standard_nodes:
             nodes = self._solver.find_roots(
-                self.get_standard_lejandr_polynomial(nodes_count),
-                self.standard_line_segment,
-                self._accuracy,
-                int(self.standard_line_segment.length // 0.001),
+                self.get_standard_lejandr_polynomial(nodes_count), self.standard_line_segment, self._accuracy
             )
             self._standard_nodes[nodes_count] = nodes
         return self._standard_nodes[nodes_count]
@@ -65,7 +62,7 @@ class GaussQF:
         if nodes_count not in self._standard_coefficients:
             coefficients = [0] * nodes_count
             nodes = self.get_nodes_in_standard_line_segment(nodes_count)
-            polynomial = get_lambda_func(self.get_standard_lejandr_polynomial(nodes_count - 1))
+            polynomial = get_lambda_func(self.get_standard_lejandr_polynomial(nodes_count - 1), module="math")
             for i in range(nodes_count // 2 + nodes_count % 2):
                 current_coef = (2 * (1 - (nodes[i]) ** 2)) / ((nodes_count * polynomial(nodes[i])) ** 2)
                 coefficients[i] = current_coef
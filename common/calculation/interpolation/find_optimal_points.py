@@ -1,9 +1,70 @@
+import heapq
+from bisect import bisect_left
 from typing import List, Union, Sequence
 
+import numpy as np
+
 
 def find_optimal_points(x: float, points: List[Union[float, Sequence[float]]], number_of_points: int, key=lambda x: x):
     if len(points) < number_of_points:
         raise ValueError("Too few points.")
-    distances = [(i, abs(x - key(point))) for i, point in enumerate(points)]
-    sorted_distances = sorted(distances, key=lambda y: y[1])
-    return [points[dist[0]] for dist in sorted_distances[:number_of_points]]
+    return heapq.nsmallest(number_of_points, points, key=lambda point: abs(x - key(point)))
+
+
+class SortedNodeIndex:
+    """
+    Sorts the points by key once, then the nearest points to x form a window of the sorted keys.
+    A query costs O(log N + k) instead of sorting all the distances.
+    Of two equally distant points the left one is taken.
+    """
+
+    def __init__(self, points: Sequence[Union[float, Sequence[float]]], key=lambda x: x):
+        self.points = list(points)
+        keys = np.array([key(point) for point in self.points], dtype=float)
+        self._order = np.argsort(keys, kind="stable")
+        self._keys = keys[self._order]
+        self._key_list = self._keys.tolist()
+
+    def __len__(self):
+        return len(self.points)
+
+    def find_optimal_points(self, x: float, number_of_points: int) -> List[Union[float, Sequence[float]]]:
+        """The nearest points in the ascending order of the key."""
+
+        start = self._find_window_start(x, number_of_points)
+        return [self.points[i] for i in self._order[start : start + number_of_points].tolist()]
+
+    def find_optimal_indices(self, xs: Sequence[float], number_of_points: int) -> np.ndarray:
+        """For each x, the indices of the nearest points in the ascending order of the key. The shape is (m, k)."""
+
+        xs = np.asarray(xs, dtype=float)
+        self._check_number_of_points(number_of_points)
+        # The window start lies in [position - k, position], the binary search over it is done for all xs at once.
+        positions = np.searchsorted(self._keys, xs)
+        lows = np.maximum(positions - number_of_points, 0)
+        highs = np.minimum(positions, len(self) - number_of_points)
+        is_active = lows < highs
+        while np.any(is_active):
+            middles = (lows + highs) // 2
+            # For the active xs middle + k <= N - 1, the others are clipped only to stay in the array.
+            right_ends = self._keys[np.minimum(middles + number_of_points, len(self) - 1)]
+            is_right = xs - self._keys[middles] > right_ends - xs
+            lows = np.where(is_active & is_right, middles + 1, lows)
+            highs = np.where(is_active & ~is_right, middles, highs)
+            is_active = lows < highs
+        return self._order[lows[:, np.newaxis] + np.arange(number_of_points)]
+
+    def _find_window_start(self, x: float, number_of_points: int) -> int:
+        self._check_number_of_points(number_of_points)
+        right = bisect_left(self._key_list, x)
+        left = right - 1
+        for _ in range(number_of_points):
+            if right >= len(self) or (left >= 0 and x - self._key_list[left] <= self._key_list[right] - x):
+                left -= 1
+            else:
+                right += 1
+        return left + 1
+
+    def _check_number_of_points(self, number_of_points: int):
+        if len(self) < number_of_points:
+            raise ValueError("Too few points.")
@@ -0,0 +1,131 @@
+from enum import Enum
+from math import lgamma
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from common.calculation.interpolation.interpolators.interpolator import FittingInterpolator
+
+
+class NodeGrid(Enum):
+    EQUIDISTANT = "equidistant"
+    CHEBYSHEV = "chebyshev"
+
+
+def get_node_grid(sorted_nodes: np.ndarray) -> Optional[NodeGrid]:
+    """
+    The grid between the outer nodes that the sorted nodes are on up to rounding, or None.
+    The Chebyshev nodes are the first-kind ones, the outer nodes are center -+ radius cos(pi / 2n).
+    """
+
+    number_of_nodes = sorted_nodes.size
+    if number_of_nodes == 0:
+        return None
+    left, right = sorted_nodes[0], sorted_nodes[-1]
+    tolerance = 1e-12 * max(right - left, np.abs(sorted_nodes).max())
+    if np.all(np.abs(sorted_nodes - np.linspace(left, right, number_of_nodes)) <= tolerance):
+        return NodeGrid.EQUIDISTANT
+
+    angles = (2 * np.arange(number_of_nodes) + 1) * np.pi / (2 * number_of_nodes)
+    radius = (right - left) / (2 * np.cos(angles[0]))
+    chebyshev_nodes = (left + right) / 2 - radius * np.cos(angles)
+    if np.all(np.abs(sorted_nodes - chebyshev_nodes) <= tolerance):
+        return NodeGrid.CHEBYSHEV
+    return None
+
+
+def get_barycentric_weights(nodes: np.ndarray) -> np.ndarray:
+    """
+    The weights w_j = 1 / prod_{k != j} (x_j - x_k) up to a common factor, which cancels in the second form.
+    Equidistant and Chebyshev nodes get the closed-form weights, any other nodes are processed in O(n^2).
+    """
+
+    closed_form_weights = _get_closed_form_weights(nodes)
+    if closed_form_weights is not None:
+        return closed_form_weights
+
+    differences = nodes[:, np.newaxis] - nodes[np.newaxis, :]
+    np.fill_diagonal(differences, 1.0)
+    # The products are summed as logarithms, so that they neither overflow nor underflow for many nodes.
+    logarithms = np.log(np.abs(differences)).sum(axis=1)
+    signs = np.prod(np.sign(differences), axis=1)
+    return signs * np.exp(logarithms.min() - logarithms)
+
+
+def _get_closed_form_weights(nodes: np.ndarray) -> Optional[np.ndarray]:
+    number_of_nodes = nodes.size
+    if number_of_nodes < 3:
+        return None
+    degree = number_of_nodes - 1
+    alternating_signs = (-1.0) ** np.arange(number_of_nodes)
+    order = np.argsort(nodes)
+
+    node_grid = get_node_grid(nodes[order])
+    weights = np.empty(number_of_nodes)
+    if node_grid is NodeGrid.EQUIDISTANT:
+        # (-1)^j C(n, j), divided by C(n, n / 2)
+        logarithms = np.array([lgamma(degree + 1) - lgamma(j + 1) - lgamma(degree - j + 1) for j in range(degree + 1)])
+        weights[order] = alternating_signs * np.exp(logarithms - logarithms.max())
+        return weights
+    if node_grid is NodeGrid.CHEBYSHEV:
+        # (-1)^j sin((2j + 1) pi / (2n + 2))
+        angles = (2 * np.arange(number_of_nodes) + 1) * np.pi / (2 * number_of_nodes)
+        weights[order] = alternating_signs * np.sin(angles)
+        return weights
+    return None
+
+
+class BarycentricPolynomial:
+    """
+    The interpolation polynomial in the second barycentric form. It takes a number or an array of them.
+    Other weights, given in the order of the nodes, turn it into a rational interpolant.
+    """
+
+    def __init__(self, value_table: Tuple[Sequence[float], Sequence[float]], weights: Optional[np.ndarray] = None):
+        self.nodes = np.asarray(value_table[0], dtype=float)
+        self.values = np.asarray(value_table[1], dtype=float)
+        if len(set(self.nodes.tolist())) != self.nodes.size:
+            raise ValueError("The nodes must be distinct.")
+        self.weights = get_barycentric_weights(self.nodes) if weights is None else np.asarray(weights, dtype=float)
+
+    def __call__(self, x):
+        points = np.asarray(x, dtype=float)
+        flat_points = points.reshape(-1)
+        differences = flat_points[:, np.newaxis] - self.nodes[np.newaxis, :]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            terms = self.weights / differences
+            result = (terms @ self.values) / terms.sum(axis=1)
+        # At the nodes the formula gives inf / inf, the values are taken as they are.
+        point_indices, node_indices = np.nonzero(differences == 0)
+        result[point_indices] = self.values[node_indices]
+
+        if points.ndim == 0:
+            return float(result[0])
+        return result.reshape(points.shape)
+
+    def value_and_derivative(self, x: float) -> Tuple[float, float]:
+        """
+        p'(x) = sum w_j (p(x) - y_j) / (x - x_j)^2 / sum w_j / (x - x_j). At the node x_k it is
+        sum over j != k of (w_j / w_k) (y_k - y_j) / (x_j - x_k).
+        """
+
+        differences = x - self.nodes
+        node_indices = np.flatnonzero(differences == 0)
+        if node_indices.size:
+            k = node_indices[0]
+            other = np.arange(self.nodes.size) != k
+            value = float(self.values[k])
+            terms = self.weights[other] / self.weights[k] * (value - self.values[other]) / (-differences[other])
+            return value, float(terms.sum())
+        terms = self.weights / differences
+        value = float(terms @ self.values / terms.sum())
+        return value, float((terms * (value - self.values) / differences).sum() / terms.sum())
+
+
+class BarycentricInterpolator(FittingInterpolator):
+    """The weights are computed once per value table, then each value costs O(n)."""
+
+    name = "Барицентрическая форма"
+
+    def _build_polynomial(self, value_table: Tuple[List[float], List[float]]) -> BarycentricPolynomial:
+        return BarycentricPolynomial(value_table)
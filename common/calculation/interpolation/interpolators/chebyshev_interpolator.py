@@ -0,0 +1,127 @@
+from typing import Callable, List, Sequence, Tuple
+
+import numpy as np
+
+from common.calculation.interpolation.interpolators.barycentric_interpolator import (
+    BarycentricPolynomial,
+    NodeGrid,
+    get_node_grid,
+)
+from common.calculation.interpolation.interpolators.interpolator import FittingInterpolator
+from common.calculation.root_finding.utils import get_values
+from common.models.line_segment import LineSegment
+from common.models.point_generation import ChebyshevPointGenerator
+
+
+def get_chebyshev_coefficients(values: Sequence[float]) -> np.ndarray:
+    """
+    The coefficients of the interpolation polynomial in the Chebyshev basis by the values at the Chebyshev nodes
+    in the ascending order, as ChebyshevPointGenerator gives them. It is the DCT-II done by one FFT of length n.
+    """
+
+    # In the ascending order the node i is cos((2j + 1) pi / 2n) with j = n - 1 - i.
+    values = np.asarray(values, dtype=float)[::-1]
+    number_of_values = values.size
+    reordered_values = np.concatenate((values[::2], values[1::2][::-1]))
+    shifts = np.exp(-1j * np.pi * np.arange(number_of_values) / (2 * number_of_values))
+    coefficients = (np.fft.fft(reordered_values) * shifts).real * 2 / number_of_values
+    coefficients[0] /= 2
+    return coefficients
+
+
+class ChebyshevSeries:
+    """The sum of c_k T_k(t), where t maps the line segment to [-1, 1]. It takes a number or an array of them."""
+
+    def __init__(self, coefficients: Sequence[float], line_segment: LineSegment):
+        self.coefficients = np.asarray(coefficients, dtype=float)
+        self.line_segment = line_segment
+
+    @classmethod
+    def from_values(cls, values: Sequence[float], line_segment: LineSegment) -> "ChebyshevSeries":
+        """The values are at ChebyshevPointGenerator().generate(line_segment, len(values))."""
+
+        return cls(get_chebyshev_coefficients(values), line_segment)
+
+    @classmethod
+    def from_function(
+        cls, function: Callable, line_segment: LineSegment, tolerance: float = 1e-14, max_degree: int = 2 ** 16
+    ) -> "ChebyshevSeries":
+        """
+        Doubles the number of nodes until the last coefficients drop below tolerance relative to the largest one,
+        or until the degree reaches max_degree, then chops the negligible tail.
+        """
+
+        max_number_of_nodes = max_degree + 1
+        number_of_nodes = min(17, max_number_of_nodes)
+        while True:
+            nodes = np.array(ChebyshevPointGenerator().generate(line_segment, number_of_nodes))
+            series = cls.from_values(get_values(function, nodes), line_segment)
+            tail = np.abs(series.coefficients[-max(2, number_of_nodes // 8) :])
+            if tail.max() <= tolerance * np.abs(series.coefficients).max() or number_of_nodes == max_number_of_nodes:
+                return series.chop(tolerance)
+            number_of_nodes = min(2 * number_of_nodes - 1, max_number_of_nodes)
+
+    @property
+    def degree(self) -> int:
+        return self.coefficients.size - 1
+
+    def chop(self, tolerance: float) -> "ChebyshevSeries":
+        """Drops the last coefficients which are below tolerance relative to the largest one."""
+
+        is_significant = np.abs(self.coefficients) > tolerance * np.abs(self.coefficients).max()
+        number_of_coefficients = np.flatnonzero(is_significant)[-1] + 1 if is_significant.any() else 1
+        return ChebyshevSeries(self.coefficients[:number_of_coefficients], self.line_segment)
+
+    def __call__(self, x):
+        points = np.asarray(x, dtype=float)
+        t = (2 * points - self.line_segment.left - self.line_segment.right) / self.line_segment.length
+        # The Clenshaw recurrence b_k = c_k + 2 t b_{k+1} - b_{k+2}, the value is c_0 + t b_1 - b_2.
+        next_b = np.zeros(points.shape)
+        next_next_b = np.zeros(points.shape)
+        for coefficient in self.coefficients[:0:-1].tolist():
+            next_b, next_next_b = coefficient + 2 * t * next_b - next_next_b, next_b
+        result = self.coefficients[0] + t * next_b - next_next_b
+        return float(result) if points.ndim == 0 else result
+
+    def value_and_derivative(self, x: float) -> Tuple[float, float]:
+        """The Clenshaw recurrence together with its derivative by t, times dt/dx."""
+
+        t = (2 * x - self.line_segment.left - self.line_segment.right) / self.line_segment.length
+        next_b = next_next_b = next_db = next_next_db = 0.0
+        for coefficient in self.coefficients[:0:-1].tolist():
+            next_db, next_next_db = 2 * next_b + 2 * t * next_db - next_next_db, next_db
+            next_b, next_next_b = coefficient + 2 * t * next_b - next_next_b, next_b
+        value = float(self.coefficients[0]) + t * next_b - next_next_b
+        return value, (next_b + t * next_db - next_next_db) * 2 / self.line_segment.length
+
+
+class ChebyshevInterpolator(FittingInterpolator):
+    """
+    On the Chebyshev nodes of a segment the coefficients are found by FFT in O(n log n) and the polynomial is evaluated
+    by the Clenshaw recurrence. Any other nodes give the same polynomial in the barycentric form.
+    """
+
+    name = "Форма Чебышёва"
+
+    def __init__(self, tolerance: float = 0.0):
+        super().__init__()
+        self.tolerance = tolerance
+
+    def _build_polynomial(self, value_table: Tuple[List[float], List[float]]) -> Callable:
+        order = np.argsort(value_table[0])
+        nodes, values = np.asarray(value_table[0], dtype=float)[order], np.asarray(value_table[1], dtype=float)[order]
+        line_segment = self._get_line_segment_of_chebyshev_nodes(nodes)
+        if line_segment is None:
+            return BarycentricPolynomial((nodes, values))
+        return ChebyshevSeries.from_values(values, line_segment).chop(self.tolerance)
+
+    @staticmethod
+    def _get_line_segment_of_chebyshev_nodes(sorted_nodes: np.ndarray):
+        """The segment whose Chebyshev nodes are the given ones, or None."""
+
+        if get_node_grid(sorted_nodes) is not NodeGrid.CHEBYSHEV:
+            return None
+        # The outer nodes are center -+ radius cos(pi / 2n).
+        radius = (sorted_nodes[-1] - sorted_nodes[0]) / (2 * np.cos(np.pi / (2 * sorted_nodes.size)))
+        center = (sorted_nodes[-1] + sorted_nodes[0]) / 2
+        return LineSegment(center - radius, center + radius)
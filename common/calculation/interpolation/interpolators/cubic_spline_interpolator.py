@@ -0,0 +1,137 @@
+from enum import Enum
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+from common.calculation.interpolation.interpolators.interpolator import FittingInterpolator
+
+
+class SplineEndCondition(Enum):
+    NATURAL = "natural"  # S''(a) = S''(b) = 0
+    CLAMPED = "clamped"  # S'(a) and S'(b) are given
+    NOT_A_KNOT = "not-a-knot"  # S''' is continuous at the second and the next to last nodes
+
+
+def solve_tridiagonal(lower: List[float], diagonal: List[float], upper: List[float], right_side: List[float]):
+    """The Thomas algorithm. lower[0] and upper[-1] are not used. The system must be diagonally dominant."""
+
+    size = len(diagonal)
+    upper_ratios = [0.0] * size
+    solution = [0.0] * size
+    previous_ratio = previous_solution = 0.0
+    for i in range(size):
+        denominator = diagonal[i] - lower[i] * previous_ratio
+        previous_ratio = upper_ratios[i] = upper[i] / denominator
+        previous_solution = solution[i] = (right_side[i] - lower[i] * previous_solution) / denominator
+    for i in range(size - 2, -1, -1):
+        solution[i] -= upper_ratios[i] * solution[i + 1]
+    return solution
+
+
+class CubicSpline:
+    """
+    The piecewise cubic polynomial y_i + b_i s + c_i s^2 + d_i s^3, s = x - x_i, on each [x_i, x_{i+1}].
+    The coefficients are stored in one (N - 1, 4) array. It takes a number or an array of them,
+    the points outside of the nodes get the end polynomials.
+    """
+
+    def __init__(
+        self,
+        value_table: Tuple[Sequence[float], Sequence[float]],
+        end_condition: SplineEndCondition = SplineEndCondition.NOT_A_KNOT,
+        end_derivatives: Tuple[float, float] = (0.0, 0.0),
+    ):
+        nodes = np.asarray(value_table[0], dtype=float)
+        order = np.argsort(nodes, kind="stable")
+        self.nodes = nodes[order]
+        values = np.asarray(value_table[1], dtype=float)[order]
+        if self.nodes.size < 2:
+            raise ValueError("A spline needs at least two nodes.")
+        steps = np.diff(self.nodes)
+        if np.any(steps == 0):
+            raise ValueError("The nodes must be distinct.")
+
+        slopes = np.diff(values) / steps
+        moments = self._get_moments(steps, slopes, end_condition, end_derivatives)
+        self.coefficients = np.column_stack(
+            (
+                values[:-1],
+                slopes - steps * (2 * moments[:-1] + moments[1:]) / 6,
+                moments[:-1] / 2,
+                np.diff(moments) / (6 * steps),
+            )
+        )
+
+    @staticmethod
+    def _get_moments(
+        steps: np.ndarray, slopes: np.ndarray, end_condition: SplineEndCondition, end_derivatives: Tuple[float, float]
+    ) -> np.ndarray:
+        """
+        The second derivatives M_i at the nodes from h_{i-1} M_{i-1} + 2 (h_{i-1} + h_i) M_i + h_i M_{i+1}
+        = 6 (d_i - d_{i-1}) with the two equations of the end condition.
+        """
+
+        number_of_parts = steps.size
+        h, d = steps.tolist(), slopes.tolist()
+        if end_condition is SplineEndCondition.NOT_A_KNOT and number_of_parts < 3:
+            # Two parts give the interpolation parabola, one part gives the line.
+            second_derivative = 2 * (d[1] - d[0]) / (h[0] + h[1]) if number_of_parts == 2 else 0.0
+            return np.full(number_of_parts + 1, second_derivative)
+
+        lower, upper = h[:-1], h[1:]
+        diagonal = [2 * (h[i] + h[i + 1]) for i in range(number_of_parts - 1)]
+        right_side = [6 * (d[i + 1] - d[i]) for i in range(number_of_parts - 1)]
+
+        if end_condition is SplineEndCondition.NATURAL:
+            moments = [0.0] + (solve_tridiagonal(lower, diagonal, upper, right_side) if right_side else []) + [0.0]
+            return np.array(moments)
+
+        if end_condition is SplineEndCondition.CLAMPED:
+            lower, upper = [0.0] + h, h + [0.0]
+            diagonal = [2 * h[0]] + diagonal + [2 * h[-1]]
+            right_side = [6 * (d[0] - end_derivatives[0])] + right_side + [6 * (end_derivatives[1] - d[-1])]
+            return np.array(solve_tridiagonal(lower, diagonal, upper, right_side))
+
+        # Not-a-knot: M_0 = ((h_0 + h_1) M_1 - h_0 M_2) / h_1 is put into the first equation, and the same at the end.
+        diagonal[0] += h[0] * (h[0] + h[1]) / h[1]
+        upper[0] -= h[0] * h[0] / h[1]
+        diagonal[-1] += h[-1] * (h[-1] + h[-2]) / h[-2]
+        lower[-1] -= h[-1] * h[-1] / h[-2]
+        inner_moments = solve_tridiagonal(lower, diagonal, upper, right_side)
+        first_moment = ((h[0] + h[1]) * inner_moments[0] - h[0] * inner_moments[1]) / h[1]
+        last_moment = ((h[-1] + h[-2]) * inner_moments[-1] - h[-1] * inner_moments[-2]) / h[-2]
+        return np.array([first_moment] + inner_moments + [last_moment])
+
+    def __call__(self, x):
+        points = np.asarray(x, dtype=float)
+        indices = np.clip(np.searchsorted(self.nodes, points, side="right") - 1, 0, self.coefficients.shape[0] - 1)
+        shifts = points - self.nodes[indices]
+        coefficients = self.coefficients[indices]
+        result = coefficients[..., 0] + shifts * (
+            coefficients[..., 1] + shifts * (coefficients[..., 2] + shifts * coefficients[..., 3])
+        )
+        return float(result) if points.ndim == 0 else result
+
+    def value_and_derivative(self, x: float) -> Tuple[float, float]:
+        index = min(max(int(np.searchsorted(self.nodes, x, side="right")) - 1, 0), self.coefficients.shape[0] - 1)
+        shift = x - float(self.nodes[index])
+        a, b, c, d = self.coefficients[index].tolist()
+        return a + shift * (b + shift * (c + shift * d)), b + shift * (2 * c + shift * 3 * d)
+
+
+class CubicSplineInterpolator(FittingInterpolator):
+    """The moments of the spline are found by one tridiagonal solve, so building costs O(N)."""
+
+    name = "Кубический сплайн"
+
+    def __init__(
+        self,
+        end_condition: SplineEndCondition = SplineEndCondition.NOT_A_KNOT,
+        end_derivatives: Tuple[float, float] = (0.0, 0.0),
+    ):
+        super().__init__()
+        self.end_condition = end_condition
+        self.end_derivatives = end_derivatives
+
+    def _build_polynomial(self, value_table: Tuple[List[float], List[float]]) -> CubicSpline:
+        return CubicSpline(value_table, self.end_condition, self.end_derivatives)
@@ -0,0 +1,58 @@
+from math import comb
+from typing import List, Tuple
+
+import numpy as np
+
+from common.calculation.interpolation.interpolators.barycentric_interpolator import (
+    BarycentricPolynomial,
+    NodeGrid,
+    get_node_grid,
+)
+from common.calculation.interpolation.interpolators.interpolator import FittingInterpolator
+
+
+def get_floater_hormann_weights(sorted_nodes: np.ndarray, blending_degree: int) -> np.ndarray:
+    """
+    w_k = (-1)^{k - d} sum_{i = max(0, k - d)}^{min(k, n - d)} prod_{j = i, j != k}^{i + d} 1 / |x_k - x_j|.
+    On an equidistant grid the products are C(d, k - i) up to a common factor, so the weights cost O(N d).
+    """
+
+    number_of_nodes = sorted_nodes.size
+    degree = min(blending_degree, number_of_nodes - 1)
+    # The rows are the windows of d + 1 consecutive nodes, the columns are the positions of x_k in them.
+    windows = np.arange(number_of_nodes - degree)[:, np.newaxis] + np.arange(degree + 1)
+
+    if get_node_grid(sorted_nodes) is NodeGrid.EQUIDISTANT:
+        terms = np.broadcast_to(np.array([comb(degree, m) for m in range(degree + 1)], dtype=float), windows.shape)
+    else:
+        window_nodes = sorted_nodes[windows]
+        differences = np.abs(window_nodes[:, :, np.newaxis] - window_nodes[:, np.newaxis, :])
+        differences[:, np.arange(degree + 1), np.arange(degree + 1)] = 1.0
+        terms = 1 / differences.prod(axis=2)
+
+    weights = np.zeros(number_of_nodes)
+    np.add.at(weights, windows, terms)
+    weights *= (-1.0) ** (np.arange(number_of_nodes) - degree)
+    return weights / np.abs(weights).max()
+
+
+class FloaterHormannInterpolator(FittingInterpolator):
+    """
+    The rational interpolant blending the polynomials of degree d on all the windows of d + 1 consecutive nodes.
+    It has no poles on the real line and converges as O(h^{d + 1}) on any grid, equidistant ones included.
+    d = n gives the interpolation polynomial.
+    """
+
+    name = "Рациональная форма Флоатера — Хормана"
+
+    def __init__(self, blending_degree: int = 3):
+        super().__init__()
+        if blending_degree < 0:
+            raise ValueError("The blending degree must be non-negative.")
+        self.blending_degree = blending_degree
+
+    def _build_polynomial(self, value_table: Tuple[List[float], List[float]]) -> BarycentricPolynomial:
+        nodes, values = np.asarray(value_table[0], dtype=float), np.asarray(value_table[1], dtype=float)
+        order = np.argsort(nodes, kind="stable")
+        nodes, values = nodes[order], values[order]
+        return BarycentricPolynomial((nodes, values), get_floater_hormann_weights(nodes, self.blending_degree))
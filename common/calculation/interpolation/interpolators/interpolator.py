@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Tuple, List
+from typing import Callable, Tuple, List, Optional, Sequence
 
 from common.models.named import Named
 
@@ -8,3 +8,36 @@ class Interpolator(ABC, Named):
     @abstractmethod
     def get_approximate_value(self, x: float, value_table: Tuple[List[float], List[float]]):
         pass
+
+    def fit(self, value_table: Tuple[List[float], List[float]]) -> Callable:
+        """Returns the interpolation polynomial of the value table as a function of x."""
+
+        def polynomial(x):
+            return self.get_approximate_value(x, value_table)
+
+        return polynomial
+
+
+class FittingInterpolator(Interpolator, ABC):
+    """
+    Builds a polynomial object once per value table and evaluates it for each x.
+    The last fitted polynomial is kept, so that repeated calls with the same table don't build it again.
+    """
+
+    def __init__(self):
+        self._value_table: Optional[Tuple[List[float], List[float]]] = None
+        self._polynomial: Optional[Callable] = None
+
+    @abstractmethod
+    def _build_polynomial(self, value_table: Tuple[List[float], List[float]]) -> Callable:
+        pass
+
+    def fit(self, value_table: Tuple[Sequence[float], Sequence[float]]) -> Callable:
+        table = (list(value_table[0]), list(value_table[1]))
+        if table != self._value_table:
+            self._polynomial = self._build_polynomial(table)
+            self._value_table = table
+        return self._polynomial
+
+    def get_approximate_value(self, x: float, value_table: Tuple[Sequence[float], Sequence[float]]):
+        return self.fit(value_table)(x)
@@ -0,0 +1,58 @@
+from dataclasses import dataclass
+from math import inf
+from typing import List, Optional, Sequence, Tuple
+
+from common.calculation.interpolation.find_optimal_points import find_optimal_points
+from common.calculation.interpolation.interpolators.interpolator import Interpolator
+
+
+@dataclass
+class NevilleResult:
+    value: float
+    degree: int
+    error_estimate: float
+
+
+class NevilleInterpolator(Interpolator):
+    """
+    Neville's scheme at one point x. The nodes are added from the nearest to x, each one adds a row of the tableau
+    in O(n), and the difference between two successive values is the error estimate. It stops as soon as the estimate
+    is within tolerance, or when it has grown max_growths times in a row, then the value with the least estimate
+    is returned. So the degree is chosen by the data instead of being given.
+    """
+
+    name = "Схема Невилля"
+
+    def __init__(self, tolerance: float = 1e-12, max_degree: Optional[int] = None, max_growths: int = 2):
+        self.tolerance = tolerance
+        self.max_degree = max_degree
+        self.max_growths = max_growths
+
+    def get_approximate_value(self, x: float, value_table: Tuple[List[float], List[float]]):
+        return self.evaluate(x, value_table).value
+
+    def evaluate(self, x: float, value_table: Tuple[Sequence[float], Sequence[float]]) -> NevilleResult:
+        number_of_points = len(value_table[0])
+        if self.max_degree is not None:
+            number_of_points = min(number_of_points, self.max_degree + 1)
+        points = find_optimal_points(x, list(zip(*value_table)), number_of_points, key=lambda point: point[0])
+
+        nodes, row = [], []
+        best_result = last_result = None
+        number_of_growths = 0
+        for node, value in points:
+            # row[i] is the value at x of the polynomial by the nodes from the i-th to the newest one.
+            nodes.append(node)
+            row.append(value)
+            for i in range(len(row) - 2, -1, -1):
+                row[i] = ((x - nodes[i]) * row[i + 1] - (x - node) * row[i]) / (node - nodes[i])
+
+            error_estimate = inf if last_result is None else abs(row[0] - last_result.value)
+            is_growing = last_result is not None and error_estimate >= last_result.error_estimate
+            number_of_growths = number_of_growths + 1 if is_growing else 0
+            last_result = NevilleResult(row[0], len(row) - 1, error_estimate)
+            if best_result is None or error_estimate < best_result.error_estimate:
+                best_result = last_result
+            if error_estimate <= self.tolerance or number_of_growths >= self.max_growths:
+                break
+        return best_result
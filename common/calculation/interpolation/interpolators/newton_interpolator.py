@@ -1,34 +1,130 @@
-from typing import Sequence, Tuple
+from typing import Sequence, Tuple, List
 
-from common.calculation.interpolation.interpolators.interpolator import Interpolator
+import numpy as np
 
+from common.calculation.interpolation.interpolators.interpolator import FittingInterpolator
 
-class NewtonInterpolator(Interpolator):
-    name = "Форма Ньютона"
+
+class NewtonPolynomial:
+    """The interpolation polynomial in the Newton form. It takes a number or an array of them."""
 
     # value table = ([<x>, ...], [<y>, ...])
-    def get_approximate_value(self, x: float, value_table: Tuple[Sequence[float], Sequence[float]]):
-        parted_differences = self._get_parted_differences(value_table)
-        approximate_value = 0
-        differences_prod = 1.0
-        for i in range(len(value_table[0])):
-            approximate_value += parted_differences[i] * differences_prod
-            differences_prod *= x - value_table[0][i]
-        return approximate_value
+    def __init__(self, value_table: Tuple[Sequence[float], Sequence[float]]):
+        self.nodes = np.asarray(value_table[0], dtype=float)
+        self.parted_differences = self._get_parted_differences(self.nodes, value_table[1])
+
+    def __call__(self, x):
+        points = np.asarray(x, dtype=float)
+        result = np.full(points.shape, self.parted_differences[-1])
+        for i in range(self.nodes.size - 2, -1, -1):
+            result = result * (points - self.nodes[i]) + self.parted_differences[i]
+        return float(result) if points.ndim == 0 else result
+
+    def value_and_derivative(self, x: float) -> Tuple[float, float]:
+        """p(x) and p'(x) by Horner's scheme, the derivative is accumulated along with the value."""
+
+        value, derivative = float(self.parted_differences[-1]), 0.0
+        for node, parted_difference in zip(self.nodes[-2::-1].tolist(), self.parted_differences[-2::-1].tolist()):
+            derivative = derivative * (x - node) + value
+            value = value * (x - node) + parted_difference
+        return value, derivative
 
     @staticmethod
-    def _get_parted_differences(value_table):
-        parted_differences = [value_table[1][0]]
-        prev_differences_level = value_table[1]
-        number_of_values = len(value_table[0])
-        for i in range(1, number_of_values):
-            cur_differences_level = []
-            for j in range(number_of_values - i):
-                new_value = (prev_differences_level[j + 1] - prev_differences_level[j]) / (
-                    value_table[0][i + j] - value_table[0][j]
-                )
-                cur_differences_level.append(new_value)
-            parted_differences.append(cur_differences_level[0])
-
-            prev_differences_level = cur_differences_level
+    def _get_parted_differences(nodes: np.ndarray, values: Sequence[float]) -> np.ndarray:
+        """f(x_0), f(x_0, x_1), ..., f(x_0, ..., x_n). Each level overwrites the previous one in the same array."""
+
+        parted_differences = np.array(values, dtype=float)
+        for i in range(1, nodes.size):
+            parted_differences[i:] = (parted_differences[i:] - parted_differences[i - 1 : -1]) / (
+                nodes[i:] - nodes[:-i]
+            )
         return parted_differences
+
+
+class IncrementalNewtonPolynomial(NewtonPolynomial):
+    """
+    The Newton form that takes the nodes one by one. Only the last diagonal of the divided differences table
+    f(x_n), f(x_{n-1}, x_n), ..., f(x_0, ..., x_n) is kept, so a new node costs O(n).
+    """
+
+    def __init__(self, value_table: Tuple[Sequence[float], Sequence[float]] = ((), ())):
+        self._nodes = np.empty(4)
+        self._parted_differences = np.empty(4)
+        self._last_diagonal = np.empty(4)
+        self._size = 0
+        for node, value in zip(*value_table):
+            self.add_node(node, value)
+
+    @property
+    def nodes(self) -> np.ndarray:
+        return self._nodes[: self._size]
+
+    @property
+    def parted_differences(self) -> np.ndarray:
+        return self._parted_differences[: self._size]
+
+    @property
+    def degree(self) -> int:
+        return self._size - 1
+
+    def add_node(self, node: float, value: float):
+        if self._size == self._nodes.size:
+            for name in ("_nodes", "_parted_differences", "_last_diagonal"):
+                setattr(self, name, np.resize(getattr(self, name), 2 * self._size))
+
+        new_diagonal_value = value
+        for i in range(self._size):
+            previous_diagonal_value = self._last_diagonal[i]
+            self._last_diagonal[i] = new_diagonal_value
+            new_diagonal_value = (new_diagonal_value - previous_diagonal_value) / (
+                node - self._nodes[self._size - 1 - i]
+            )
+        self._last_diagonal[self._size] = new_diagonal_value
+        self._nodes[self._size] = node
+        self._parted_differences[self._size] = new_diagonal_value
+        self._size += 1
+
+    def __call__(self, x):
+        if self._size == 0:
+            raise ValueError("The polynomial has no nodes.")
+        return super().__call__(x)
+
+    def value_and_derivative(self, x: float) -> Tuple[float, float]:
+        if self._size == 0:
+            raise ValueError("The polynomial has no nodes.")
+        return super().value_and_derivative(x)
+
+    def get_error_estimate(self, x):
+        """
+        The absolute value of the newest term f(x_0, ..., x_n) (x - x_0)...(x - x_{n-1}). It is the difference between
+        the polynomial and the polynomial without the newest node.
+        """
+
+        points = np.asarray(x, dtype=float)
+        product = np.full(points.shape, abs(self._parted_differences[self._size - 1]))
+        for node in self.nodes[:-1].tolist():
+            product = product * np.abs(points - node)
+        return float(product) if points.ndim == 0 else product
+
+
+class NewtonInterpolator(FittingInterpolator):
+    name = "Форма Ньютона"
+
+    def _build_polynomial(self, value_table: Tuple[List[float], List[float]]) -> NewtonPolynomial:
+        return NewtonPolynomial(value_table)
+
+    @staticmethod
+    def fit_adaptively(
+        x: float, value_table: Tuple[Sequence[float], Sequence[float]], tolerance: float
+    ) -> IncrementalNewtonPolynomial:
+        """
+        Adds the nodes from the nearest to x until the error estimate at x drops below tolerance
+        or the nodes run out.
+        """
+
+        polynomial = IncrementalNewtonPolynomial()
+        for i in sorted(range(len(value_table[0])), key=lambda j: abs(x - value_table[0][j])):
+            polynomial.add_node(value_table[0][i], value_table[1][i])
+            if polynomial.degree > 0 and polynomial.get_error_estimate(x) < tolerance:
+                break
+        return polynomial
@@ -0,0 +1,75 @@
+import numpy as np
+
+
+class SlidingWindowInterpolator:
+    """
+    The interpolation polynomial of the last window_size samples of a stream.
+    The samples are kept in a ring buffer, and the polynomial is kept in the Newton form with the newest node first:
+    f(x_k) + f(x_k, x_{k-1}) (x - x_k) + ... + f(x_k, ..., x_{k-m+1}) (x - x_k)...(x - x_{k-m+2}).
+    A new sample updates these divided differences in O(m), the oldest one is dropped by forgetting the last of them.
+    Nothing is allocated per sample.
+    """
+
+    def __init__(self, window_size: int):
+        if window_size < 1:
+            raise ValueError("The window must contain at least one sample.")
+        self.window_size = window_size
+        self._nodes = np.empty(window_size)
+        self._values = np.empty(window_size)
+        self._parted_differences = np.empty(window_size)
+        self._new_parted_differences = np.empty(window_size)
+        self._newest = -1
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def degree(self) -> int:
+        return self._size - 1
+
+    @property
+    def nodes(self) -> np.ndarray:
+        """The nodes of the window from the oldest to the newest."""
+
+        return self._nodes[self._get_chronological_indices()]
+
+    @property
+    def values(self) -> np.ndarray:
+        return self._values[self._get_chronological_indices()]
+
+    def add_sample(self, node: float, value: float):
+        size = min(self._size + 1, self.window_size)
+        new_differences, differences = self._new_parted_differences, self._parted_differences
+        new_differences[0] = value
+        for j in range(1, size):
+            # f(x_n, ..., x_{n-j}) = (f(x_n, ..., x_{n-j+1}) - f(x_{n-1}, ..., x_{n-j})) / (x_n - x_{n-j}), x_n is new
+            previous_node = self._nodes[(self._newest - j + 1) % self.window_size]
+            if previous_node == node:
+                raise ValueError("The node is already in the window.")
+            new_differences[j] = (new_differences[j - 1] - differences[j - 1]) / (node - previous_node)
+
+        self._parted_differences, self._new_parted_differences = new_differences, differences
+        self._newest = (self._newest + 1) % self.window_size
+        self._nodes[self._newest] = node
+        self._values[self._newest] = value
+        self._size = size
+
+    def add_samples(self, nodes, values):
+        for node, value in zip(nodes, values):
+            self.add_sample(node, value)
+
+    def __call__(self, x):
+        """Horner's scheme over the nodes from the oldest to the newest one, O(m) for each point."""
+
+        if self._size == 0:
+            raise ValueError("The window has no samples.")
+        points = np.asarray(x, dtype=float)
+        result = self._parted_differences[self._size - 1]
+        for j in range(self._size - 2, -1, -1):
+            node = self._nodes[(self._newest - j) % self.window_size]
+            result = result * (points - node) + self._parted_differences[j]
+        return float(result) if points.ndim == 0 else np.broadcast_to(result, points.shape).astype(float)
+
+    def _get_chronological_indices(self) -> np.ndarray:
+        return (self._newest - np.arange(self._size - 1, -1, -1)) % self.window_size
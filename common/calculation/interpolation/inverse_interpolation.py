@@ -0,0 +1,70 @@
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from common.calculation.interpolation.find_optimal_points import SortedNodeIndex
+from common.calculation.interpolation.interpolators.barycentric_interpolator import BarycentricInterpolator
+from common.calculation.interpolation.interpolators.interpolator import Interpolator
+
+
+class InverseInterpolator:
+    """
+    Interpolates x(F) by the table (f(x), x) of a strictly monotone function. The nodes are indexed by f(x) once,
+    the nearest number_of_points of them to F form a window, and the inverse polynomial of each window is fitted once.
+    A batch of F is grouped by the windows, so each polynomial is evaluated for all its F at once.
+    """
+
+    def __init__(
+        self,
+        value_table: Tuple[Sequence[float], Sequence[float]],
+        number_of_points: int,
+        interpolator: Optional[Interpolator] = None,
+    ):
+        nodes, values = np.asarray(value_table[0], dtype=float), np.asarray(value_table[1], dtype=float)
+        steps = np.diff(values[np.argsort(nodes, kind="stable")])
+        if not (np.all(steps > 0) or np.all(steps < 0)):
+            raise ValueError("The function must be strictly monotone on the nodes.")
+        if nodes.size < number_of_points:
+            raise ValueError("Too few points.")
+
+        self.nodes, self.values = nodes, values
+        self.number_of_points = number_of_points
+        self.interpolator = interpolator if interpolator is not None else BarycentricInterpolator()
+        self._index = SortedNodeIndex(values.tolist())
+        self._polynomials: Dict[int, Callable] = {}
+
+    def get_value_table(self, f_value: float) -> Tuple[List[float], List[float]]:
+        """The window of F as ([f(x), ...], [x, ...]) in the ascending order of f(x)."""
+
+        indices = self._index.find_optimal_indices([f_value], self.number_of_points)[0]
+        return self.values[indices].tolist(), self.nodes[indices].tolist()
+
+    def get_polynomial(self, f_value: float) -> Callable:
+        """The inverse polynomial of the window of F."""
+
+        return self._get_polynomial(self._index.find_optimal_indices([f_value], self.number_of_points)[0])
+
+    def __call__(self, f_values):
+        points = np.asarray(f_values, dtype=float)
+        flat_points = points.reshape(-1)
+        windows = self._index.find_optimal_indices(flat_points, self.number_of_points)
+        # A window is defined by its first node, the F of one window are evaluated together.
+        _, first_occurrences, window_numbers = np.unique(windows[:, 0], return_index=True, return_inverse=True)
+        order = np.argsort(window_numbers, kind="stable")
+        bounds = np.searchsorted(window_numbers[order], np.arange(first_occurrences.size + 1))
+
+        result = np.empty(flat_points.size)
+        for i, first_occurrence in enumerate(first_occurrences.tolist()):
+            group = order[bounds[i] : bounds[i + 1]]
+            result[group] = self._get_polynomial(windows[first_occurrence])(flat_points[group])
+
+        if points.ndim == 0:
+            return float(result[0])
+        return result.reshape(points.shape)
+
+    def _get_polynomial(self, window: np.ndarray) -> Callable:
+        key = int(window[0])
+        polynomial = self._polynomials.get(key)
+        if polynomial is None:
+            polynomial = self._polynomials[key] = self.interpolator.fit((self.values[window], self.nodes[window]))
+        return polynomial
@@ -0,0 +1,232 @@
+from dataclasses import dataclass
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+from common.calculation.root_finding.utils import get_lambda_func, get_values
+from common.models.line_segment import LineSegment
+
+
+@dataclass
+class LevelSetStatistic:
+    number_of_brackets: int = 0
+    number_of_function_evaluations: int = 0
+
+
+@dataclass
+class _Brackets:
+    """The brackets of f(x) = level. The values are of f itself, they are not shifted by the level."""
+
+    lefts: np.ndarray
+    rights: np.ndarray
+    left_values: np.ndarray
+    right_values: np.ndarray
+    levels: np.ndarray
+
+    def __getitem__(self, indices) -> "_Brackets":
+        return _Brackets(
+            self.lefts[indices],
+            self.rights[indices],
+            self.left_values[indices],
+            self.right_values[indices],
+            self.levels[indices],
+        )
+
+    def __setitem__(self, indices, brackets: "_Brackets"):
+        self.lefts[indices] = brackets.lefts
+        self.rights[indices] = brackets.rights
+        self.left_values[indices] = brackets.left_values
+        self.right_values[indices] = brackets.right_values
+
+
+class LevelSetRootCalculator:
+    """
+    Solves f(x) = level for many levels at once. The function is evaluated on the grid only once, every level is
+    bracketed from these values, and all brackets are refined together by the Illinois method.
+    The levels of one grid part are refined in two rounds: the brackets of the second round are narrowed
+    by the results of their neighbors from the first one.
+    """
+
+    def __init__(self, max_iterations: int = 200):
+        self.max_iterations = max_iterations
+        self.stat = LevelSetStatistic()
+
+    def find_roots_for_levels(
+        self,
+        function,
+        line_segment: LineSegment,
+        levels: Sequence[float],
+        accuracy,
+        number_of_steps: int = 100,
+        variable: str = "x",
+    ) -> List[List[float]]:
+        """
+        Returns the sorted roots of each level in the order of levels. The grid has number_of_steps parts, 100 as
+        in the task scripts; the roots of one level closer than a part to each other may be missed.
+        """
+
+        self.stat = LevelSetStatistic()
+        function = get_lambda_func(function, variable)
+        levels = np.asarray(levels, dtype=float)
+        if levels.size == 0:
+            return []
+
+        grid = np.linspace(line_segment.left, line_segment.right, number_of_steps + 1)
+        values = self._evaluate(function, grid)
+        brackets, level_indices, ranks = self._bracket_levels(grid, values, levels)
+        self.stat.number_of_brackets = level_indices.size
+
+        is_first_round = ranks % 2 == 0
+        brackets[is_first_round] = self._refine(function, brackets[is_first_round], accuracy)
+        second_round = np.flatnonzero(~is_first_round)
+        if second_round.size > 0:
+            warm_brackets = self._narrow_by_neighbors(brackets, ranks, second_round)
+            brackets[second_round] = self._refine(function, warm_brackets, accuracy)
+
+        roots = (brackets.lefts + brackets.rights) / 2
+        order = np.lexsort((roots, level_indices))
+        counts = np.bincount(level_indices, minlength=levels.size)
+        return [part.tolist() for part in np.split(roots[order], np.cumsum(counts)[:-1])]
+
+    def _evaluate(self, function, points: np.ndarray) -> np.ndarray:
+        self.stat.number_of_function_evaluations += points.size
+        return get_values(function, points)
+
+    @staticmethod
+    def _bracket_levels(
+        grid: np.ndarray, values: np.ndarray, levels: np.ndarray
+    ) -> Tuple[_Brackets, np.ndarray, np.ndarray]:
+        """
+        Finds the pairs (grid part, level) with f - level changing the sign on the part. A level equal to a grid value
+        belongs to the part on the right of the node only, so the root is not found twice.
+        Returns the brackets, the indices of their levels, and the ranks of the levels within their grid parts.
+        """
+
+        level_order = np.argsort(levels, kind="stable")
+        sorted_levels = levels[level_order]
+        left_values, right_values = values[:-1], values[1:]
+        lower, upper = np.minimum(left_values, right_values), np.maximum(left_values, right_values)
+        is_finite = np.isfinite(lower) & np.isfinite(upper)
+        starts = np.where(is_finite, np.searchsorted(sorted_levels, lower, "left"), 0)
+        ends = np.where(is_finite, np.searchsorted(sorted_levels, upper, "right"), 0)
+
+        counts = ends - starts
+        part_indices = np.repeat(np.arange(counts.size), counts)
+        first_pair_of_part = np.repeat(np.cumsum(counts) - counts, counts)
+        ranks = np.arange(part_indices.size) - first_pair_of_part
+        level_indices = level_order[starts[part_indices] + ranks]
+
+        brackets = _Brackets(
+            grid[:-1][part_indices],
+            grid[1:][part_indices],
+            left_values[part_indices],
+            right_values[part_indices],
+            levels[level_indices],
+        )
+        is_last_part = part_indices == counts.size - 1
+        is_kept = (brackets.right_values != brackets.levels) | is_last_part
+        # The ranks are recomputed, so that the neighbors in a part stay in the different rounds.
+        part_indices, level_indices = part_indices[is_kept], level_indices[is_kept]
+        kept_counts = np.bincount(part_indices, minlength=counts.size)
+        ranks = np.arange(part_indices.size) - np.repeat(np.cumsum(kept_counts) - kept_counts, kept_counts)
+        return brackets[is_kept], level_indices, ranks
+
+    @staticmethod
+    def _narrow_by_neighbors(brackets: _Brackets, ranks: np.ndarray, indices: np.ndarray) -> _Brackets:
+        """
+        The refined brackets of the previous and the next levels of a part lie inside the bracket of the level,
+        so the nearest of their ends with the sign change of f - level give a narrower bracket.
+        """
+
+        neighbors = []
+        for shift in (-1, 1):
+            neighbor_indices = indices + shift
+            is_neighbor = (neighbor_indices >= 0) & (neighbor_indices < ranks.size)
+            neighbor_indices = np.where(is_neighbor, neighbor_indices, indices)
+            is_neighbor &= ranks[neighbor_indices] == ranks[indices] + shift
+            neighbor_indices = np.where(is_neighbor, neighbor_indices, indices)
+            neighbors.append(neighbor_indices)
+
+        own = brackets[indices]
+        points = np.column_stack(
+            [own.lefts]
+            + [brackets.lefts[neighbor] for neighbor in neighbors]
+            + [brackets.rights[neighbor] for neighbor in neighbors]
+            + [own.rights]
+        )
+        values = np.column_stack(
+            [own.left_values]
+            + [brackets.left_values[neighbor] for neighbor in neighbors]
+            + [brackets.right_values[neighbor] for neighbor in neighbors]
+            + [own.right_values]
+        )
+        order = np.argsort(points, axis=1, kind="stable")
+        points = np.take_along_axis(points, order, axis=1)
+        values = np.take_along_axis(values, order, axis=1)
+        shifted_values = values - own.levels[:, np.newaxis]
+
+        first_change = np.argmax(shifted_values[:, :-1] * shifted_values[:, 1:] <= 0, axis=1)[:, np.newaxis]
+        return _Brackets(
+            np.take_along_axis(points, first_change, axis=1)[:, 0],
+            np.take_along_axis(points, first_change + 1, axis=1)[:, 0],
+            np.take_along_axis(values, first_change, axis=1)[:, 0],
+            np.take_along_axis(values, first_change + 1, axis=1)[:, 0],
+            own.levels,
+        )
+
+    def _refine(self, function, brackets: _Brackets, accuracy) -> _Brackets:
+        """
+        The Illinois method: the regula falsi step with the value at the end that stays twice being halved.
+        If a bracket does not halve in three steps, the next step is the bisection one.
+        """
+
+        brackets = brackets[np.arange(brackets.lefts.size)]
+        lefts, rights, levels = brackets.lefts, brackets.rights, brackets.levels
+        left_values, right_values = brackets.left_values, brackets.right_values
+        left_weights, right_weights = np.ones(lefts.size), np.ones(lefts.size)
+        # 1 if the left end stayed at the last step, -1 if the right end did.
+        kept_sides = np.zeros(lefts.size, dtype=int)
+
+        is_left_root, is_right_root = left_values == levels, right_values == levels
+        rights[is_left_root], right_values[is_left_root] = lefts[is_left_root], left_values[is_left_root]
+        lefts[is_right_root], left_values[is_right_root] = rights[is_right_root], right_values[is_right_root]
+        reference_widths = rights - lefts
+
+        active = np.flatnonzero(rights - lefts > 2 * accuracy)
+        for iteration in range(self.max_iterations):
+            if active.size == 0:
+                break
+            a, b = lefts[active], rights[active]
+            fa = (left_values[active] - levels[active]) * left_weights[active]
+            fb = (right_values[active] - levels[active]) * right_weights[active]
+            with np.errstate(all="ignore"):
+                points = (a * fb - b * fa) / (fb - fa)
+            is_bisection = ~((points > a) & (points < b))
+            if iteration % 3 == 2:
+                widths = b - a
+                is_bisection |= widths > reference_widths[active] / 2
+                reference_widths[active] = widths
+            points[is_bisection] = ((a + b) / 2)[is_bisection]
+
+            values = self._evaluate(function, points)
+            shifted_values = values - levels[active]
+            is_root = shifted_values == 0
+            to_left = (left_values[active] - levels[active]) * shifted_values < 0
+            to_right = ~to_left & ~is_root
+
+            lanes = active[to_left]
+            rights[lanes], right_values[lanes], right_weights[lanes] = points[to_left], values[to_left], 1
+            left_weights[lanes[kept_sides[lanes] == 1]] /= 2
+            kept_sides[lanes] = 1
+
+            lanes = active[to_right]
+            lefts[lanes], left_values[lanes], left_weights[lanes] = points[to_right], values[to_right], 1
+            right_weights[lanes[kept_sides[lanes] == -1]] /= 2
+            kept_sides[lanes] = -1
+
+            lanes = active[is_root]
+            lefts[lanes] = rights[lanes] = points[is_root]
+            left_values[lanes] = right_values[lanes] = values[is_root]
+
+            active = active[rights[active] - lefts[active] > 2 * accuracy]
+        return brackets
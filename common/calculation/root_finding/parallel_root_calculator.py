@@ -0,0 +1,96 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+from typing import Optional, Tuple
+
+from sympy import srepr, sympify
+from sympy.core.assumptions import ManagedProperties
+
+from common.calculation.root_finding.root_calculator import RootCalculator, RootCalculatorStatistic
+from common.calculation.root_finding.root_separator import RootSeparator
+from common.calculation.root_finding.singe_solvers.single_root_solver import BatchRootSolver
+from common.calculation.root_finding.utils import Statistic, StatisticPolicy, get_lambda_func
+from common.models.line_segment import LineSegment
+
+# The state of a worker process. It is set once by _init_worker and shared by all tasks of the worker.
+_worker_solver = None
+_worker_function = None
+_worker_accuracy = None
+_worker_variable = "x"
+
+
+def _init_worker(single_root_solver, function, is_expression_source: bool, accuracy, variable: str):
+    global _worker_solver, _worker_function, _worker_accuracy, _worker_variable
+
+    if is_expression_source:
+        function = sympify(function)
+        if not single_root_solver.requires_symbolic_function:
+            function = get_lambda_func(function, variable)
+    _worker_solver = single_root_solver
+    _worker_function = function
+    _worker_accuracy = accuracy
+    _worker_variable = variable
+
+
+def _refine_segment(bounds: Tuple[float, float]) -> Tuple[Optional[float], Statistic]:
+    root = _worker_solver.find_root(_worker_function, LineSegment(*bounds), _worker_accuracy, _worker_variable)
+    return root, replace(_worker_solver.stat)
+
+
+class ParallelRootCalculator(RootCalculator):
+    """
+    Refines the separated segments in a process pool. The roots are returned in the order of the segments.
+    A sympy expression is sent to the workers as a string, a plain function must be picklable.
+    """
+
+    def __init__(
+        self,
+        single_root_solver,
+        root_separator: Optional[RootSeparator] = None,
+        use_polynomial_root_finder: bool = True,
+        max_workers: Optional[int] = None,
+        statistic_policy: StatisticPolicy = StatisticPolicy.FULL,
+        statistic_capacity: Optional[int] = None,
+    ):
+        super().__init__(
+            single_root_solver, root_separator, use_polynomial_root_finder, statistic_policy, statistic_capacity
+        )
+        self.max_workers = max_workers
+
+    def find_roots(self, function, line_segment, accuracy, number_of_steps, variable: str = "x"):
+        is_polynomial = self.polynomial_root_finder is not None and self.polynomial_root_finder.is_polynomial(
+            function, variable
+        )
+        if is_polynomial or isinstance(self.single_root_solver, BatchRootSolver):
+            return super().find_roots(function, line_segment, accuracy, number_of_steps, variable)
+
+        self.stat = RootCalculatorStatistic()
+        self.stat.segments = self.root_separator.separate(function, line_segment, number_of_steps, variable)
+        if not self.stat.segments:
+            return []
+
+        is_expression_source = isinstance(type(function), ManagedProperties)
+        initial_arguments = (
+            self.single_root_solver,
+            srepr(function) if is_expression_source else function,
+            is_expression_source,
+            accuracy,
+            variable,
+        )
+        number_of_workers = self.max_workers or os.cpu_count() or 1
+        chunk_size = max(1, len(self.stat.segments) // (4 * number_of_workers))
+        with ProcessPoolExecutor(number_of_workers, initializer=_init_worker, initargs=initial_arguments) as executor:
+            results = list(
+                executor.map(
+                    _refine_segment,
+                    [(segment.left, segment.right) for segment in self.stat.segments],
+                    chunksize=chunk_size,
+                )
+            )
+
+        roots = []
+        for root, statistic in results:
+            if self.statistic_policy is not StatisticPolicy.OFF:
+                self.stat.single_solver_statistics.append(statistic)
+            roots.append(root)
+        return roots
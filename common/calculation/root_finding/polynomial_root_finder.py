@@ -0,0 +1,179 @@
+from typing import List, Tuple, Callable, Optional
+
+import numpy as np
+from numpy.polynomial import Chebyshev, Polynomial
+from sympy import Poly, Symbol
+from sympy.core.assumptions import ManagedProperties
+
+from common.calculation.compiled_functions import get_compiled_function
+from common.calculation.interpolation.interpolators.barycentric_interpolator import BarycentricPolynomial
+from common.calculation.root_finding.utils import Statistic, StatisticPolicy, get_values
+from common.models.line_segment import LineSegment
+
+EPSILON = np.finfo(float).eps
+
+
+class PolynomialRootFinder:
+    """
+    Finds all real roots of a polynomial in a line segment with one eigenvalue solve.
+    The polynomial is interpolated in the Chebyshev basis of the segment, the roots are the eigenvalues
+    of its colleague matrix. Then they can be polished by Newton's method with the original polynomial.
+
+    A polynomial can be given as a sympy Poly or a polynomial sympy expression, as an array of coefficients
+    in ascending order, or as a value table ([<x>, ...], [<y>, ...]) of the interpolation polynomial.
+    """
+
+    def __init__(self, polish: bool = True, max_polish_iterations: int = 10):
+        self.polish = polish
+        self.max_polish_iterations = max_polish_iterations
+        self.statistic_policy = StatisticPolicy.FULL
+        self.statistic_capacity = Statistic.capacity
+        self.statistics: List[Statistic] = []
+
+    def set_statistic_policy(self, policy: StatisticPolicy, capacity: Optional[int] = None):
+        self.statistic_policy = policy
+        if capacity is not None:
+            self.statistic_capacity = capacity
+
+    @staticmethod
+    def is_polynomial(function, variable: str = "x") -> bool:
+        if isinstance(function, Poly):
+            return function.free_symbols <= {Symbol(variable)}
+        if isinstance(type(function), ManagedProperties):
+            return function.free_symbols <= {Symbol(variable)} and function.is_polynomial(Symbol(variable))
+        if isinstance(function, (list, tuple, np.ndarray)):
+            try:
+                shape = np.shape(np.asarray(function, dtype=float))
+            except (TypeError, ValueError):
+                return False
+            return len(shape) == 1 or (len(shape) == 2 and shape[0] == 2)
+        return False
+
+    def find_roots(self, polynomial, line_segment: LineSegment, accuracy, variable: str = "x") -> List[float]:
+        self.statistics = []
+        degree, function, coefficients = self._get_degree_function_and_coefficients(polynomial, variable)
+        if degree < 1:
+            return []
+
+        approximation = Chebyshev.interpolate(
+            lambda x: get_values(function, x), degree, domain=[line_segment.left, line_segment.right]
+        )
+        if not np.any(approximation.coef):
+            return []
+        # The values of f below the error of computing them are taken as zero, it is 2 n eps times the terms at most.
+        rounding_level = 2 * degree * EPSILON * self._get_value_scale(coefficients, approximation, line_segment)
+        candidates = self._get_candidates(function, approximation.roots(), line_segment, accuracy, rounding_level)
+
+        derivative = approximation.deriv()
+        roots = []
+        for candidate in candidates.tolist():
+            statistic = Statistic(policy=self.statistic_policy, capacity=self.statistic_capacity)
+            statistic.reset()
+            statistic.add_value(candidate)
+            root = candidate
+            if self.polish:
+                root = self._polish(function, derivative, candidate, statistic, line_segment, accuracy)
+            if not roots or abs(root - roots[-1]) > accuracy:
+                roots.append(root)
+                if self.statistic_policy is not StatisticPolicy.OFF:
+                    statistic.set_final_residual(function, root)
+                    self.statistics.append(statistic)
+        return roots
+
+    @staticmethod
+    def _get_candidates(
+        function, eigenvalues: np.ndarray, line_segment: LineSegment, accuracy, rounding_level: float
+    ) -> np.ndarray:
+        """The real roots in the line segment among the eigenvalues, in the ascending order."""
+
+        # The eigenvalues of a root of multiplicity m are spread by about eps^(1/m) of the segment length, so up to
+        # the triple roots get through. The complex roots that get through with them are dropped below.
+        spread = max(accuracy, EPSILON ** (1 / 3) * line_segment.length)
+        eigenvalues = eigenvalues[np.abs(eigenvalues.imag) <= spread]
+        eigenvalues = eigenvalues[np.argsort(eigenvalues.real)]
+        points, radii = eigenvalues.real, np.abs(eigenvalues.imag)
+        is_inside = (points >= line_segment.left - spread) & (points <= line_segment.right + spread)
+        points, radii = np.clip(points[is_inside], line_segment.left, line_segment.right), radii[is_inside]
+        if points.size == 0:
+            return points
+
+        # A multiple root turns into a cluster of eigenvalues, between which f stays at the rounding level.
+        # Close distinct roots have larger values between them, so they aren't merged.
+        is_split = np.diff(points) > spread
+        is_split |= np.abs(get_values(function, (points[:-1] + points[1:]) / 2)) > rounding_level
+        cluster_starts = np.concatenate(([0], np.flatnonzero(is_split) + 1))
+        cluster_ends = np.concatenate((cluster_starts[1:] - 1, [points.size - 1]))
+        centers = np.add.reduceat(points, cluster_starts) / (cluster_ends - cluster_starts + 1)
+        # A double root is found to about sqrt(eps) of the segment length, it is the least radius.
+        radii = np.maximum.reduce(
+            [
+                np.maximum.reduceat(radii, cluster_starts),
+                (points[cluster_ends] - points[cluster_starts]) / 2,
+                np.full(centers.shape, max(accuracy, np.sqrt(EPSILON) * line_segment.length)),
+            ]
+        )
+
+        # A complex pair close to the real axis gives a real candidate too. A root is kept if f is at the rounding
+        # level at it or f changes sign around it.
+        is_root = np.abs(get_values(function, centers)) <= rounding_level
+        is_root |= np.sign(get_values(function, centers - radii)) * np.sign(get_values(function, centers + radii)) < 0
+        return centers[is_root]
+
+    def _polish(
+        self, function, derivative, candidate: float, statistic: Statistic, line_segment: LineSegment, accuracy
+    ) -> float:
+        """Newton's method with the values of the original polynomial. The iterations are added to statistic."""
+
+        cur_value, cur_function_value = candidate, float(function(candidate))
+        for _ in range(self.max_polish_iterations):
+            derivative_value = float(derivative(cur_value))
+            if derivative_value == 0:
+                break
+            next_value = cur_value - cur_function_value / derivative_value
+            if not line_segment.contains(next_value):
+                break
+            next_function_value = float(function(next_value))
+            # Near a multiple root the derivative is almost zero, and the step may jump towards another root.
+            if abs(next_function_value) > abs(cur_function_value):
+                break
+            statistic.add_value(next_value)
+            is_converged = abs(next_value - cur_value) <= accuracy
+            cur_value, cur_function_value = next_value, next_function_value
+            if is_converged:
+                break
+        return cur_value
+
+    @staticmethod
+    def _get_degree_function_and_coefficients(polynomial, variable: str) -> Tuple[int, Callable, Optional[np.ndarray]]:
+        """
+        The degree, the function to evaluate and the monomial coefficients in ascending order, if there are any.
+        A sympy polynomial is evaluated as it is written, e.g. by the recurrence it is built with. Its monomial
+        coefficients may be much larger than its values, so they are used only for the degree and the rounding bound.
+        """
+
+        if isinstance(polynomial, Poly):
+            expression = polynomial.as_expr()
+        elif isinstance(type(polynomial), ManagedProperties):
+            expression, polynomial = polynomial, Poly(polynomial, Symbol(variable))
+        else:
+            array = np.asarray(polynomial, dtype=float)
+            if array.ndim == 1:
+                coefficients = np.trim_zeros(array, "b")
+                return coefficients.size - 1, Polynomial(coefficients), coefficients
+            return array.shape[1] - 1, BarycentricPolynomial((array[0], array[1])), None
+
+        coefficients = np.array(polynomial.all_coeffs()[::-1], dtype=float)
+        return polynomial.degree(), get_compiled_function(expression, variable), coefficients
+
+    @staticmethod
+    def _get_value_scale(
+        coefficients: Optional[np.ndarray], approximation: Chebyshev, line_segment: LineSegment
+    ) -> float:
+        """The bound of the terms summed to compute f on the segment, f is computed to about eps times it."""
+
+        scale = float(np.abs(approximation.coef).sum())
+        if coefficients is not None:
+            # The monomial terms can be much larger than the values because of cancellation.
+            radius = max(abs(line_segment.left), abs(line_segment.right))
+            scale = max(scale, float(Polynomial(np.abs(coefficients))(radius)))
+        return scale
@@ -1,29 +1,72 @@
 from dataclasses import replace, dataclass, field
-from typing import List
+from typing import List, Optional
 
+from common.calculation.root_finding.polynomial_root_finder import PolynomialRootFinder
 from common.calculation.root_finding.root_separator import RootSeparator
-from common.calculation.root_finding.utils import Statistic
+from common.calculation.root_finding.singe_solvers.single_root_solver import BatchRootSolver
+from common.calculation.root_finding.utils import Statistic, StatisticPolicy
+from common.models.line_segment import LineSegment
 
 
 @dataclass
 class RootCalculatorStatistic:
-    segments: List[float] = field(default_factory=list)
+    segments: List[LineSegment] = field(default_factory=list)
     single_solver_statistics: List[Statistic] = field(default_factory=list)
 
 
 class RootCalculator:
-    def __init__(self, single_root_solver):
+    def __init__(
+        self,
+        single_root_solver,
+        root_separator: Optional[RootSeparator] = None,
+        use_polynomial_root_finder: bool = True,
+        statistic_policy: StatisticPolicy = StatisticPolicy.FULL,
+        statistic_capacity: Optional[int] = None,
+    ):
         self.single_root_solver = single_root_solver
-        self.root_separator = RootSeparator()
+        self.root_separator = RootSeparator() if root_separator is None else root_separator
+        self.polynomial_root_finder = PolynomialRootFinder() if use_polynomial_root_finder else None
         self.stat = RootCalculatorStatistic()
+        self.set_statistic_policy(statistic_policy, statistic_capacity)
+
+    def set_statistic_policy(self, policy: StatisticPolicy, capacity: Optional[int] = None):
+        """
+        OFF keeps only the found segments, SUMMARY keeps the number of iterations and the final residual of each root,
+        BOUNDED keeps the last capacity iterations, FULL keeps all of them.
+        """
+
+        self.statistic_policy = policy
+        self.single_root_solver.set_statistic_policy(policy, capacity)
+        if self.polynomial_root_finder is not None:
+            self.polynomial_root_finder.set_statistic_policy(policy, capacity)
 
     def find_roots(self, function, line_segment, accuracy, number_of_steps, variable: str = "x"):
+        self.stat = RootCalculatorStatistic()
+        if self.polynomial_root_finder is not None and self.polynomial_root_finder.is_polynomial(function, variable):
+            return self._find_polynomial_roots(function, line_segment, accuracy, variable)
+        if isinstance(self.single_root_solver, BatchRootSolver):
+            return self._find_roots_in_batch(function, line_segment, accuracy, number_of_steps, variable)
+
         self.stat.segments = self.root_separator.separate(function, line_segment, number_of_steps, variable)
         roots = []
 
         for segment in self.stat.segments:
             root = self.single_root_solver.find_root(function, segment, accuracy, variable)
-            self.stat.single_solver_statistics.append(replace(self.single_root_solver.stat))
+            if self.statistic_policy is not StatisticPolicy.OFF:
+                self.stat.single_solver_statistics.append(replace(self.single_root_solver.stat))
             roots.append(root)
 
         return roots
+
+    def _find_roots_in_batch(self, function, line_segment, accuracy, number_of_steps, variable: str = "x"):
+        lefts, rights = self.root_separator.separate_as_arrays(function, line_segment, number_of_steps, variable)
+        self.stat.segments = [LineSegment(left, right) for left, right in zip(lefts.tolist(), rights.tolist())]
+        roots = self.single_root_solver.find_roots(function, lefts, rights, accuracy, variable)
+        self.stat.single_solver_statistics.extend(self.single_root_solver.statistics)
+        return roots.tolist()
+
+    def _find_polynomial_roots(self, polynomial, line_segment, accuracy, variable: str = "x"):
+        roots = self.polynomial_root_finder.find_roots(polynomial, line_segment, accuracy, variable)
+        self.stat.segments = []
+        self.stat.single_solver_statistics.extend(self.polynomial_root_finder.statistics)
+        return roots
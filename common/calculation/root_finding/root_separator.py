@@ -1,16 +1,43 @@
-from typing import List
-from sympy import lambdify
+from dataclasses import dataclass
+from typing import List, Tuple
 
-from common.calculation.root_finding.utils import get_lambda_func
+import numpy as np
+
+from common.calculation.root_finding.utils import get_lambda_func, get_vectorized_values, get_values
 from common.models.line_segment import LineSegment
 from config import COMPUTER_DEVIATION
 
 
 class RootSeparator:
-    @staticmethod
-    def separate(expression, line_segment: LineSegment, number_of_steps: int, variable: str = "x") -> List[LineSegment]:
+    def separate(
+        self, expression, line_segment: LineSegment, number_of_steps: int, variable: str = "x"
+    ) -> List[LineSegment]:
+        lefts, rights = self.separate_as_arrays(expression, line_segment, number_of_steps, variable)
+        return [LineSegment(left, right) for left, right in zip(lefts.tolist(), rights.tolist())]
+
+    def separate_as_arrays(
+        self, expression, line_segment: LineSegment, number_of_steps: int, variable: str = "x"
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns the left and the right ends of all found segments as two arrays."""
+
         function = get_lambda_func(expression, variable)
-        segments = []
+        grid = np.linspace(line_segment.left, line_segment.right, number_of_steps + 1)
+        values = get_vectorized_values(function, grid)
+        if values is None:
+            return self._separate_by_loop(function, line_segment, number_of_steps)
+
+        left_values = values[:-1]
+        has_sign_change = left_values * values[1:] < COMPUTER_DEVIATION
+        is_selected = has_sign_change & (np.abs(left_values) > COMPUTER_DEVIATION)
+        if has_sign_change.any():
+            is_selected[np.argmax(has_sign_change)] = True
+        indices = np.flatnonzero(is_selected)
+        return grid[indices], grid[indices + 1]
+
+    @staticmethod
+    def _separate_by_loop(function, line_segment: LineSegment, number_of_steps: int) -> Tuple[np.ndarray, np.ndarray]:
+        lefts = []
+        rights = []
         step = line_segment.length / number_of_steps
         cur_segment = line_segment.copy()
         left_function_value = function(cur_segment.left)
@@ -20,10 +47,95 @@ class RootSeparator:
             right_function_value = function(cur_segment.right)
 
             if left_function_value * right_function_value < COMPUTER_DEVIATION and (
-                len(segments) == 0 or abs(left_function_value) > COMPUTER_DEVIATION
+                len(lefts) == 0 or abs(left_function_value) > COMPUTER_DEVIATION
             ):
-                segments.append(cur_segment.copy())
+                lefts.append(cur_segment.left)
+                rights.append(cur_segment.right)
             left_function_value = right_function_value
             cur_segment.left = cur_segment.right
 
-        return segments
+        return np.array(lefts, dtype=float), np.array(rights, dtype=float)
+
+
+@dataclass
+class SeparatorStatistic:
+    number_of_evaluations: int = 0
+
+
+class AdaptiveRootSeparator(RootSeparator):
+    """
+    Starts with a coarse grid of number_of_steps parts and halves only the parts where the function can have
+    several roots: it comes close to zero, varies more than its distance to zero, or its parabola through the ends
+    and the center turns back to zero.
+    """
+
+    def __init__(self, max_depth: int = 30, zero_tolerance: float = 1e-12):
+        self.max_depth = max_depth
+        self.zero_tolerance = zero_tolerance
+        self.stat = SeparatorStatistic()
+
+    def separate_as_arrays(
+        self, expression, line_segment: LineSegment, number_of_steps: int, variable: str = "x"
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        function = get_lambda_func(expression, variable)
+        grid = np.linspace(line_segment.left, line_segment.right, number_of_steps + 1)
+        values = get_values(function, grid)
+        self.stat.number_of_evaluations = grid.size
+
+        lefts, rights, left_values, right_values = grid[:-1], grid[1:], values[:-1], values[1:]
+        found = []
+        for depth in range(self.max_depth + 1):
+            if lefts.size == 0:
+                break
+            centers = (lefts + rights) / 2
+            center_values = get_values(function, centers)
+            self.stat.number_of_evaluations += centers.size
+
+            if depth < self.max_depth:
+                needs_refinement = self._has_several_roots(left_values, center_values, right_values)
+            else:
+                needs_refinement = np.zeros(centers.size, dtype=bool)
+            is_final = ~needs_refinement
+            found.append((lefts[is_final], centers[is_final], left_values[is_final], center_values[is_final]))
+            found.append((centers[is_final], rights[is_final], center_values[is_final], right_values[is_final]))
+
+            lefts, rights = (
+                np.concatenate((lefts[needs_refinement], centers[needs_refinement])),
+                np.concatenate((centers[needs_refinement], rights[needs_refinement])),
+            )
+            left_values, right_values = (
+                np.concatenate((left_values[needs_refinement], center_values[needs_refinement])),
+                np.concatenate((center_values[needs_refinement], right_values[needs_refinement])),
+            )
+
+        return self._select_segments_with_sign_change(*(np.concatenate(parts) for parts in zip(*found)))
+
+    def _has_several_roots(self, left_values: np.ndarray, center_values: np.ndarray, right_values: np.ndarray):
+        with np.errstate(all="ignore"):
+            # The parabola q(s) = center + slope * s + curvature * s^2 / 2 passes through the values at s = -1, 0, 1.
+            slope = (right_values - left_values) / 2
+            curvature = left_values - 2 * center_values + right_values
+            vertex = -slope / curvature
+            vertex_value = center_values - slope * slope / (2 * curvature)
+            turns_back_to_zero = (np.abs(vertex) < 1) & (
+                (vertex_value * center_values <= 0) | (np.abs(vertex_value) <= np.abs(curvature))
+            )
+        # The products of the small values of a refined part underflow the tolerance, so only the signs are compared.
+        center_signs = np.sign(center_values)
+        has_sign_change = (np.sign(left_values) * center_signs <= 0) | (center_signs * np.sign(right_values) <= 0)
+        distance_to_zero = np.minimum(np.minimum(np.abs(left_values), np.abs(center_values)), np.abs(right_values))
+        variation = np.maximum(np.maximum(left_values, center_values), right_values) - np.minimum(
+            np.minimum(left_values, center_values), right_values
+        )
+        is_close_to_zero = (distance_to_zero <= self.zero_tolerance) | (variation >= distance_to_zero)
+        return turns_back_to_zero | (is_close_to_zero & ~has_sign_change)
+
+    @staticmethod
+    def _select_segments_with_sign_change(lefts, rights, left_values, right_values) -> Tuple[np.ndarray, np.ndarray]:
+        order = np.argsort(lefts, kind="stable")
+        lefts, rights, left_values, right_values = lefts[order], rights[order], left_values[order], right_values[order]
+        # The parts cover the line segment, so a zero at a node is the right end of exactly one part,
+        # except the zero at the left end of the segment.
+        is_selected = (np.sign(left_values) * np.sign(right_values) < 0) | (right_values == 0)
+        is_selected[:1] |= left_values[:1] == 0
+        return lefts[is_selected], rights[is_selected]
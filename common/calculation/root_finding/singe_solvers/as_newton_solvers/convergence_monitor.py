@@ -0,0 +1,108 @@
+from enum import Enum
+from math import isfinite, log
+from typing import Optional
+
+from common.models.line_segment import LineSegment
+
+
+class StopReason(Enum):
+    CONVERGED = "converged"
+    MAX_ITERATIONS = "max iterations"
+    NOT_FINITE = "not finite value"
+    LEFT_SEGMENT = "left the segment"
+    RESIDUAL_GROWTH = "residual grows"
+    OSCILLATION = "oscillation"
+    SLOW_CONVERGENCE = "too slow convergence"
+    ZERO_SLOPE = "zero slope"
+
+
+class ConvergenceMonitor:
+    """
+    Watches the iterates of one initial value. The convergence order and ratio are estimated from the last three steps
+    e_{k+1} = ratio * e_k^order. The start is hopeless if the residual grows or the steps alternate without decreasing
+    for patience iterations in a row, if the linear convergence needs more iterations than are left for patience
+    iterations in a row, or if an iterate goes farther than segment_margin lengths of the segment from it.
+    """
+
+    def __init__(
+        self,
+        line_segment: LineSegment,
+        accuracy,
+        max_iterations: int,
+        patience: int = 3,
+        segment_margin: float = 1.0,
+    ):
+        self.accuracy = accuracy
+        self.max_iterations = max_iterations
+        self.patience = patience
+        self._left = line_segment.left - segment_margin * line_segment.length
+        self._right = line_segment.right + segment_margin * line_segment.length
+
+        self.stop_reason: Optional[StopReason] = None
+        self.order: Optional[float] = None
+        self.ratio: Optional[float] = None
+        self._number_of_steps = 0
+        self._steps = []
+        self._last_residual = None
+        self._number_of_residual_growths = 0
+        self._number_of_oscillations = 0
+        self._number_of_slow_steps = 0
+
+    def stop(self, reason: StopReason) -> StopReason:
+        self.stop_reason = reason
+        return reason
+
+    def update(self, value, function_value, next_value) -> Optional[StopReason]:
+        """Is called after each step value -> next_value. Returns the reason to stop or None."""
+
+        self._number_of_steps += 1
+        if not (isfinite(value) and isfinite(function_value) and isfinite(next_value)):
+            return self.stop(StopReason.NOT_FINITE)
+        if next_value < self._left or next_value > self._right:
+            return self.stop(StopReason.LEFT_SEGMENT)
+
+        step = next_value - value
+        if abs(step) <= self.accuracy:
+            return None
+
+        residual = abs(function_value)
+        is_growing = self._last_residual is not None and residual > self._last_residual
+        self._number_of_residual_growths = self._number_of_residual_growths + 1 if is_growing else 0
+        self._last_residual = residual
+        if self._number_of_residual_growths >= self.patience:
+            return self.stop(StopReason.RESIDUAL_GROWTH)
+
+        last_step = self._steps[-1] if self._steps else None
+        is_oscillating = last_step is not None and step * last_step < 0 and abs(step) >= abs(last_step)
+        self._number_of_oscillations = self._number_of_oscillations + 1 if is_oscillating else 0
+        if self._number_of_oscillations >= self.patience:
+            return self.stop(StopReason.OSCILLATION)
+
+        self._steps = self._steps[-2:] + [step]
+        is_slow = len(self._steps) == 3 and self._estimate_order() and self._is_too_slow()
+        self._number_of_slow_steps = self._number_of_slow_steps + 1 if is_slow else 0
+        if self._number_of_slow_steps >= self.patience:
+            return self.stop(StopReason.SLOW_CONVERGENCE)
+        return None
+
+    def _estimate_order(self) -> bool:
+        first, second, third = (abs(step) for step in self._steps)
+        if second == first or not 0 < third < second:
+            return False
+        self.order = log(third / second) / log(second / first)
+        if not isfinite(self.order) or self.order <= 0:
+            self.order = self.ratio = None
+            return False
+        self.ratio = third / second ** self.order
+        return True
+
+    def _is_too_slow(self) -> bool:
+        """Only the linear convergence is checked, the faster one finishes within a few steps anyway."""
+
+        if self.order > 1.2:
+            return False
+        last_step, linear_ratio = abs(self._steps[-1]), abs(self._steps[-1] / self._steps[-2])
+        if linear_ratio >= 1:
+            return False
+        number_of_needed_steps = log(self.accuracy / last_step) / log(linear_ratio)
+        return self._number_of_steps + number_of_needed_steps > self.max_iterations
@@ -1,36 +1,88 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from dataclasses import dataclass, field
+from math import isfinite
+from typing import List, Optional, Tuple
 
+from common.calculation.root_finding.singe_solvers.as_newton_solvers.convergence_monitor import (
+    ConvergenceMonitor,
+    StopReason,
+)
 from common.calculation.root_finding.singe_solvers.single_root_solver import SingleRootSolver
+from common.calculation.root_finding.utils import Statistic, get_lambda_func
 from common.models.line_segment import LineSegment
 
 
+@dataclass
+class IteratingStatistic(Statistic):
+    stop_reason: Optional[StopReason] = None
+    convergence_order: Optional[float] = None
+    convergence_ratio: Optional[float] = None
+    rejected_initial_values: List[Tuple[float, StopReason]] = field(default_factory=list)
+
+
 class IteratingOverInitialValues(SingleRootSolver, ABC):
+    """
+    Tries the initial values from the nearest to the regula falsi point of the segment. The iterations of each one
+    are watched by a ConvergenceMonitor, so a hopeless initial value is abandoned after a few steps.
+    """
+
     def __init__(self, max_iterations=100, max_number_of_initial_values=5):
         super().__init__()
+        self.stat = IteratingStatistic()
         self.max_iterations = max_iterations
         self.max_number_of_initial_values = max_number_of_initial_values
+        self._monitor: Optional[ConvergenceMonitor] = None
 
     def find_root(self, function, line_segment: LineSegment, accuracy, variable: str = "x") -> Optional[float]:
-        initial_value = line_segment.left
-        step = line_segment.length / self.max_number_of_initial_values
+        rejected_initial_values = []
         result = None
 
-        while result is None:
-            if initial_value > line_segment.right:
-                return None
-
+        for initial_value in self._get_initial_values(get_lambda_func(function, variable), line_segment):
+            self._monitor = ConvergenceMonitor(line_segment, accuracy, self.max_iterations)
             result = self._find_root_with_initial(function, line_segment, accuracy, initial_value, variable)
-            initial_value += step
-
-            if result is not None and (result < line_segment.left or result > line_segment.right):
+            if result is not None and not line_segment.contains(result):
+                self._monitor.stop(StopReason.LEFT_SEGMENT)
                 result = None
+            if result is not None:
+                break
+            rejected_initial_values.append((initial_value, self._monitor.stop_reason or StopReason.MAX_ITERATIONS))
 
+        self.stat.rejected_initial_values = rejected_initial_values
+        if result is None:
+            self.stat.stop_reason = rejected_initial_values[-1][1]
+            self.stat.convergence_order = self.stat.convergence_ratio = None
+            return None
+
+        self.stat.stop_reason = StopReason.CONVERGED
+        self.stat.convergence_order, self.stat.convergence_ratio = self._monitor.order, self._monitor.ratio
+        self.stat.set_final_residual(get_lambda_func(function, variable), result)
         return result
 
+    def _get_initial_values(self, func_as_lambda, line_segment: LineSegment) -> List[float]:
+        """
+        The regula falsi point goes first, then the uniform grid of the segment ordered by the distance to it.
+        The grid node that coincides with the first value is skipped, so that the same run isn't repeated,
+        and there are no more than max_number_of_initial_values values.
+        """
+
+        step = line_segment.length / self.max_number_of_initial_values
+        grid = [line_segment.left + i * step for i in range(self.max_number_of_initial_values + 1)]
+
+        left_value, right_value = func_as_lambda(line_segment.left), func_as_lambda(line_segment.right)
+        if isfinite(left_value) and isfinite(right_value) and left_value * right_value < 0:
+            best_value = float(line_segment.left - left_value * line_segment.length / (right_value - left_value))
+        else:
+            best_value = line_segment.center
+        other_values = [value for value in grid if abs(value - best_value) > 1e-12 * line_segment.length]
+        other_values.sort(key=lambda value: abs(value - best_value))
+        return [best_value] + other_values[: self.max_number_of_initial_values - 1]
+
     @abstractmethod
     def _find_root_with_initial(
         self, function, line_segment: LineSegment, accuracy, initial_value, variable: str = "x"
     ) -> Optional[float]:
-        """Does no more than max_iterations iterations. Otherwise, it returns None."""
+        """
+        Does no more than max_iterations iterations. Otherwise, it returns None.
+        Each step is passed to self._monitor, the iterations stop as soon as it finds a reason.
+        """
         pass
@@ -1,30 +1,35 @@
 from typing import Optional
 
-from sympy import lambdify, diff
-
+from common.calculation.derivative.dual_number import ValueAndDerivativeFunction
+from common.calculation.root_finding.singe_solvers.as_newton_solvers.convergence_monitor import StopReason
 from common.calculation.root_finding.singe_solvers.as_newton_solvers.iterating_over_initial_values import (
     IteratingOverInitialValues,
 )
+from common.calculation.root_finding.utils import get_lambda_func
 from common.models.line_segment import LineSegment
 
 
 class ModifiedNewtonMethodSolver(IteratingOverInitialValues):
     method_name = "Modified Newton method"
+    requires_symbolic_function = True
 
     def clear_statistic(self):
-        self.stat.values = []
+        self.stat.reset()
 
     def _find_root_with_initial(
         self, function, line_segment: LineSegment, accuracy, initial_value, variable: str = "x"
     ) -> Optional[float]:
         self.clear_statistic()
-        func_as_lambda = lambdify(variable, function)
+        func_as_lambda = get_lambda_func(function, variable)
         step_counter = 0
         prev_value = None
         cur_value = initial_value
-        derivative_value = lambdify(variable, diff(function))(initial_value)
+        _, derivative_value = ValueAndDerivativeFunction(function, variable)(initial_value)
+        if derivative_value == 0:
+            self._monitor.stop(StopReason.ZERO_SLOPE)
+            return None
 
-        self.stat.values.append(cur_value)
+        self.stat.add_value(cur_value)
 
         while prev_value is None or (abs(cur_value - prev_value) > accuracy):
             step_counter += 1
@@ -32,8 +37,11 @@ class ModifiedNewtonMethodSolver(IteratingOverInitialValues):
                 return None
 
             prev_value = cur_value
-            cur_value = prev_value - func_as_lambda(prev_value) / derivative_value
+            function_value = func_as_lambda(prev_value)
+            cur_value = prev_value - function_value / derivative_value
 
-            self.stat.values.append(cur_value)
+            self.stat.add_value(cur_value)
+            if self._monitor.update(prev_value, function_value, cur_value) is not None:
+                return None
 
         return cur_value
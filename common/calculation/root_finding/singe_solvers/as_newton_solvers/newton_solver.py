@@ -1,7 +1,7 @@
 from typing import Optional
 
-from sympy import lambdify, diff
-
+from common.calculation.derivative.dual_number import ValueAndDerivativeFunction
+from common.calculation.root_finding.singe_solvers.as_newton_solvers.convergence_monitor import StopReason
 from common.calculation.root_finding.singe_solvers.as_newton_solvers.iterating_over_initial_values import (
     IteratingOverInitialValues,
 )
@@ -10,27 +10,23 @@ from common.models.line_segment import LineSegment
 
 class NewtonMethodSolver(IteratingOverInitialValues):
     method_name = "Newton method"
+    requires_symbolic_function = True
 
     def clear_statistic(self):
-        self.stat.values = []
+        self.stat.reset()
 
     def _find_root_with_initial(
         self, function, line_segment: LineSegment, accuracy, initial_value, variable: str = "x"
     ) -> Optional[float]:
         self.clear_statistic()
-        derivative = diff(function)
-        func_as_lambda = lambdify(variable, function)
-        derivative_as_lambda = lambdify(variable, derivative)
-
-        # second_derivative = lambdify(variable, diff(derivative))
-        # if func_as_lambda(initial_value) * second_derivative(initial_value) < -COMPUTER_DEVIATION:
-        #     return None
+        # A sympy expression is differentiated symbolically, a polynomial by its formula, a callable by dual numbers.
+        value_and_derivative = ValueAndDerivativeFunction(function, variable)
 
         step_counter = 0
         prev_value = None
         cur_value = initial_value
 
-        self.stat.values.append(cur_value)
+        self.stat.add_value(cur_value)
 
         while prev_value is None or (abs(cur_value - prev_value) > accuracy):
             step_counter += 1
@@ -38,8 +34,14 @@ class NewtonMethodSolver(IteratingOverInitialValues):
                 return None
 
             prev_value = cur_value
-            cur_value = prev_value - func_as_lambda(prev_value) / derivative_as_lambda(prev_value)
+            function_value, derivative_value = value_and_derivative(prev_value)
+            if derivative_value == 0:
+                self._monitor.stop(StopReason.ZERO_SLOPE)
+                return None
+            cur_value = prev_value - function_value / derivative_value
 
-            self.stat.values.append(cur_value)
+            self.stat.add_value(cur_value)
+            if self._monitor.update(prev_value, function_value, cur_value) is not None:
+                return None
 
         return cur_value
@@ -4,15 +4,17 @@ from typing import Optional
 from sympy import lambdify
 from sympy.core.assumptions import ManagedProperties
 
+from common.calculation.root_finding.singe_solvers.as_newton_solvers.convergence_monitor import StopReason
 from common.calculation.root_finding.singe_solvers.as_newton_solvers.iterating_over_initial_values import (
     IteratingOverInitialValues,
+    IteratingStatistic,
 )
-from common.calculation.root_finding.utils import Statistic, get_lambda_func
+from common.calculation.root_finding.utils import get_lambda_func
 from common.models.line_segment import LineSegment
 
 
 @dataclass
-class StatisticWithAdditionalInitial(Statistic):
+class StatisticWithAdditionalInitial(IteratingStatistic):
     additional_value: float = 0.0
 
 
@@ -20,7 +22,7 @@ class SecantLineSolver(IteratingOverInitialValues):
     method_name = "Secant line"
 
     def clear_statistic(self):
-        self.stat.values = []
+        self.stat.reset()
         self.stat.additional_value = 0.0
 
     def __init__(self):
@@ -38,7 +40,7 @@ class SecantLineSolver(IteratingOverInitialValues):
         prev_function_value = None
         cur_value = initial_value
 
-        self.stat.values.append(cur_value)
+        self.stat.add_value(cur_value)
 
         while prev_value is None or (abs(cur_value - prev_value) > accuracy):
             step_counter += 1
@@ -56,10 +58,13 @@ class SecantLineSolver(IteratingOverInitialValues):
             prev_value = cur_value
             prev_function_value = func_as_lambda(prev_value)
             if prev_function_value - prev_prev_function_value == 0:
+                self._monitor.stop(StopReason.ZERO_SLOPE)
                 return None
             cur_value = prev_value - prev_function_value * (prev_value - prev_prev_value) / (
                 prev_function_value - prev_prev_function_value
             )
 
-            self.stat.values.append(cur_value)
+            self.stat.add_value(cur_value)
+            if self._monitor.update(prev_value, prev_function_value, cur_value) is not None:
+                return None
         return cur_value
@@ -1,9 +1,9 @@
 from dataclasses import dataclass
 
-from sympy import lambdify
+import numpy as np
 
-from common.calculation.root_finding.singe_solvers.single_root_solver import SingleRootSolver
-from common.calculation.root_finding.utils import Statistic
+from common.calculation.root_finding.singe_solvers.single_root_solver import SingleRootSolver, BatchRootSolver
+from common.calculation.root_finding.utils import Statistic, StatisticPolicy, get_values, get_lambda_func
 from common.models.line_segment import LineSegment
 from config import COMPUTER_DEVIATION
 
@@ -21,17 +21,17 @@ class BisectionSolver(SingleRootSolver):
         self.stat = BisectionStatistic()
 
     def clear_statistic(self):
-        self.stat.values = []
+        self.stat.reset()
         self.stat.last_segment_length = 0
 
     def find_root(self, function, line_segment: LineSegment, accuracy, variable: str = "x") -> float:
         self.clear_statistic()
-        func_as_lambda = lambdify(variable, function)
+        func_as_lambda = get_lambda_func(function, variable)
 
         step_counter = 0
         cur_segment = line_segment.copy()
 
-        self.stat.values.append(cur_segment.center)
+        self.stat.add_value(cur_segment.center)
 
         left_function_value = func_as_lambda(cur_segment.left)
 
@@ -45,7 +45,66 @@ class BisectionSolver(SingleRootSolver):
                 cur_segment.left = cur_segment.center
                 left_function_value = center_function_value
 
-            self.stat.values.append(cur_segment.center)
+            self.stat.add_value(cur_segment.center)
 
         self.stat.last_segment_length = cur_segment.length
+        self.stat.set_final_residual(func_as_lambda, cur_segment.center)
         return cur_segment.center
+
+
+class BatchBisectionSolver(BatchRootSolver):
+    method_name = "Batch bisection"
+
+    def find_roots(self, function, lefts: np.ndarray, rights: np.ndarray, accuracy, variable: str = "x") -> np.ndarray:
+        func_as_lambda = get_lambda_func(function, variable)
+        lefts = np.array(lefts, dtype=float)
+        rights = np.array(rights, dtype=float)
+        left_function_values = get_values(func_as_lambda, lefts)
+        step_counters = np.zeros(lefts.size, dtype=int)
+        policy = self.stat.policy
+        centers_history = [(lefts + rights) / 2] if policy in (StatisticPolicy.BOUNDED, StatisticPolicy.FULL) else None
+        previous_centers = (lefts + rights) / 2
+
+        active = np.flatnonzero(rights - lefts > 2 * accuracy)
+        while active.size > 0:
+            step_counters[active] += 1
+            centers = (lefts[active] + rights[active]) / 2
+            center_function_values = get_values(func_as_lambda, centers)
+            previous_centers[active] = centers
+
+            to_left = left_function_values[active] * center_function_values < COMPUTER_DEVIATION
+            rights[active[to_left]] = centers[to_left]
+            to_right = ~to_left
+            lefts[active[to_right]] = centers[to_right]
+            left_function_values[active[to_right]] = center_function_values[to_right]
+
+            if centers_history is not None:
+                centers_history.append((lefts + rights) / 2)
+            active = active[rights[active] - lefts[active] > 2 * accuracy]
+
+        roots = (lefts + rights) / 2
+        if policy is StatisticPolicy.OFF:
+            self.statistics = []
+        elif centers_history is not None:
+            self._fill_statistics(np.array(centers_history), step_counters + 1, step_counters, rights - lefts)
+        else:
+            last_centers = np.array([previous_centers, roots])
+            self._fill_statistics(last_centers, np.minimum(step_counters, 1) + 1, step_counters, rights - lefts)
+        if policy is not StatisticPolicy.OFF:
+            for statistic, residual in zip(self.statistics, np.abs(get_values(func_as_lambda, roots)).tolist()):
+                statistic.final_residual = residual
+        return roots
+
+    def _fill_statistics(self, centers_history: np.ndarray, numbers_of_rows, step_counters, last_segment_lengths):
+        """The i-th segment gets the first numbers_of_rows[i] rows of the i-th column of centers_history."""
+
+        self.statistics = []
+        for i, (number_of_rows, step_counter, length) in enumerate(
+            zip(numbers_of_rows.tolist(), step_counters.tolist(), last_segment_lengths.tolist())
+        ):
+            statistic = BisectionStatistic(policy=self.stat.policy, capacity=self.stat.capacity)
+            statistic.reset()
+            statistic.values.extend(centers_history[:number_of_rows, i].tolist())
+            statistic.number_of_values = step_counter + 1
+            statistic.last_segment_length = length
+            self.statistics.append(statistic)
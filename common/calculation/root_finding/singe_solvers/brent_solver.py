@@ -0,0 +1,98 @@
+import sys
+from dataclasses import dataclass
+from math import copysign
+
+from common.calculation.root_finding.singe_solvers.single_root_solver import SingleRootSolver
+from common.calculation.root_finding.utils import Statistic, StatisticPolicy, get_lambda_func
+from common.models.line_segment import LineSegment
+
+
+@dataclass
+class BrentStatistic(Statistic):
+    last_segment_length: float = 0.0
+    number_of_function_evaluations: int = 0
+
+
+class BrentSolver(SingleRootSolver):
+    """Combines inverse quadratic interpolation, secant steps and bisection, so the root always stays bracketed."""
+
+    method_name = "Brent method"
+
+    def __init__(self):
+        super().__init__()
+        self.stat = BrentStatistic()
+
+    def clear_statistic(self):
+        self.stat.reset()
+        self.stat.last_segment_length = 0.0
+        self.stat.number_of_function_evaluations = 0
+
+    def _evaluate(self, func_as_lambda, x):
+        self.stat.number_of_function_evaluations += 1
+        return func_as_lambda(x)
+
+    def _set_final_residual(self, function_value):
+        if self.stat.policy is not StatisticPolicy.OFF:
+            self.stat.final_residual = abs(float(function_value))
+
+    def find_root(self, function, line_segment: LineSegment, accuracy, variable: str = "x") -> float:
+        self.clear_statistic()
+        func_as_lambda = get_lambda_func(function, variable)
+
+        a, b = line_segment.left, line_segment.right
+        a_value, b_value = self._evaluate(func_as_lambda, a), self._evaluate(func_as_lambda, b)
+        if abs(a_value) < abs(b_value):
+            a, b, a_value, b_value = b, a, b_value, a_value
+        self.stat.add_value(b)
+        if a_value * b_value > 0:
+            # There is no sign change, the separator has chosen the segment because of the small function values.
+            self.stat.last_segment_length = line_segment.length
+            self._set_final_residual(b_value)
+            return b
+
+        c, c_value = a, a_value
+        step = previous_step = b - a
+        while True:
+            if b_value * c_value > 0:
+                c, c_value = a, a_value
+                step = previous_step = b - a
+            if abs(c_value) < abs(b_value):
+                a, b, c = b, c, b
+                a_value, b_value, c_value = b_value, c_value, b_value
+
+            tolerance = 2 * sys.float_info.epsilon * abs(b) + accuracy / 2
+            half_of_segment = (c - b) / 2
+            if abs(half_of_segment) <= tolerance or b_value == 0:
+                self.stat.last_segment_length = abs(c - b)
+                self._set_final_residual(b_value)
+                return b
+
+            if abs(previous_step) >= tolerance and abs(a_value) > abs(b_value):
+                s = b_value / a_value
+                if a == c:
+                    # secant step
+                    p = 2 * half_of_segment * s
+                    q = 1 - s
+                else:
+                    # inverse quadratic interpolation
+                    q = a_value / c_value
+                    r = b_value / c_value
+                    p = s * (2 * half_of_segment * q * (q - r) - (b - a) * (r - 1))
+                    q = (q - 1) * (r - 1) * (s - 1)
+                if p > 0:
+                    q = -q
+                else:
+                    p = -p
+                if 2 * p < min(3 * half_of_segment * q - abs(tolerance * q), abs(previous_step * q)):
+                    previous_step = step
+                    step = p / q
+                else:
+                    step = previous_step = half_of_segment
+            else:
+                step = previous_step = half_of_segment
+
+            a, a_value = b, b_value
+            b += step if abs(step) > tolerance else copysign(tolerance, half_of_segment)
+            b_value = self._evaluate(func_as_lambda, b)
+
+            self.stat.add_value(b)
@@ -1,15 +1,43 @@
 from abc import ABC, abstractmethod
+from typing import List, Optional
 
-from common.calculation.root_finding.utils import Statistic
+import numpy as np
+
+from common.calculation.root_finding.utils import Statistic, StatisticPolicy
 from common.models.line_segment import LineSegment
 
 
 class SingleRootSolver(ABC):
     method_name: str
+    # The solver differentiates a sympy expression symbolically, so it gets it rather than a compiled callable.
+    requires_symbolic_function = False
 
     def __init__(self):
         self.stat = Statistic()
 
+    def set_statistic_policy(self, policy: StatisticPolicy, capacity: Optional[int] = None):
+        self.stat.set_policy(policy, capacity)
+
     @abstractmethod
     def find_root(self, function, line_segment: LineSegment, accuracy, variable: str = "x") -> float:
         pass
+
+
+class BatchRootSolver(SingleRootSolver, ABC):
+    """Refines all segments at once. The statistics of each segment are stored in statistics."""
+
+    def __init__(self):
+        super().__init__()
+        self.statistics: List[Statistic] = []
+
+    @abstractmethod
+    def find_roots(self, function, lefts: np.ndarray, rights: np.ndarray, accuracy, variable: str = "x") -> np.ndarray:
+        pass
+
+    def find_root(self, function, line_segment: LineSegment, accuracy, variable: str = "x") -> float:
+        roots = self.find_roots(
+            function, np.array([line_segment.left]), np.array([line_segment.right]), accuracy, variable
+        )
+        if self.statistics:
+            self.stat = self.statistics[0]
+        return float(roots[0])
@@ -1,14 +1,103 @@
+from array import array
+from collections import deque
 from dataclasses import dataclass, field
-from typing import List
+from enum import Enum
+from typing import Optional, Sequence
 
-from sympy import lambdify
+import numpy as np
 from sympy.core.assumptions import ManagedProperties
 
+from common.calculation.compiled_functions import get_compiled_function
+
+
+class StatisticPolicy(Enum):
+    OFF = "off"  # nothing is stored
+    SUMMARY = "summary"  # the number of iterations, the final residual and the last two values
+    BOUNDED = "bounded"  # the last capacity values in a ring buffer
+    FULL = "full"  # all values in a compact array
+
+
+class _NoValues:
+    def append(self, value: float):
+        pass
+
+    def __getitem__(self, index):
+        raise IndexError("Values are not stored.")
+
+    def __iter__(self):
+        return iter(())
+
+    def __len__(self):
+        return 0
+
+
+def make_values_storage(policy: StatisticPolicy, capacity: int):
+    if policy is StatisticPolicy.OFF:
+        return _NoValues()
+    if policy is StatisticPolicy.SUMMARY:
+        return deque(maxlen=2)
+    if policy is StatisticPolicy.BOUNDED:
+        return deque(maxlen=capacity)
+    return array("d")
+
 
 @dataclass
 class Statistic:
-    values: List[float] = field(default_factory=list)
+    values: Sequence[float] = field(default_factory=list)
+    number_of_values: int = 0
+    final_residual: Optional[float] = None
+    policy: StatisticPolicy = StatisticPolicy.FULL
+    capacity: int = 64
+
+    @property
+    def number_of_iterations(self) -> int:
+        return max(len(self.values), self.number_of_values, 1) - 1
+
+    def set_policy(self, policy: StatisticPolicy, capacity: Optional[int] = None):
+        self.policy = policy
+        if capacity is not None:
+            self.capacity = capacity
+        self.reset()
+
+    def reset(self):
+        """New storage is created, so the copies of the statistic made before the reset stay untouched."""
+
+        self.values = make_values_storage(self.policy, self.capacity)
+        self.number_of_values = 0
+        self.final_residual = None
+
+    def add_value(self, value: float):
+        self.values.append(value)
+        self.number_of_values += 1
+
+    def set_final_residual(self, function, value: float):
+        if self.policy is not StatisticPolicy.OFF:
+            self.final_residual = abs(float(function(value)))
+
+
+def get_lambda_func(function, variable="x", module="numpy"):
+    if isinstance(type(function), ManagedProperties):
+        return get_compiled_function(function, variable, module)
+    return function
+
+
+def get_vectorized_values(function, points: np.ndarray) -> Optional[np.ndarray]:
+    """Evaluates the function on the whole array at once. If the function can't take arrays, it returns None."""
+
+    try:
+        with np.errstate(all="ignore"):
+            values = np.asarray(function(points), dtype=float)
+    except (TypeError, ValueError):
+        return None
+    if values.ndim == 0:
+        return np.full(points.shape, float(values))
+    if values.shape != points.shape:
+        return None
+    return values
 
 
-def get_lambda_func(function, variable="x"):
-    return lambdify(variable, function) if isinstance(type(function), ManagedProperties) else function
+def get_values(function, points: np.ndarray) -> np.ndarray:
+    values = get_vectorized_values(function, points)
+    if values is None:
+        values = np.array([function(point) for point in points.tolist()], dtype=float)
+    return values
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+import math
 import random
 from typing import List
 
@@ -35,6 +36,18 @@ class EquidistantPointGenerator(PointGenerator):
         return line_segment.split_into_points(number_of_points)
 
 
+class ChebyshevPointGenerator(PointGenerator):
+    """The roots of the Chebyshev polynomial of the first kind, mapped to the segment and sorted."""
+
+    name = "Чебышёвские"
+
+    def generate(self, line_segment: LineSegment, number_of_points: int) -> List[float]:
+        return [
+            line_segment.center - line_segment.length / 2 * math.cos((2 * i + 1) * math.pi / (2 * number_of_points))
+            for i in range(number_of_points)
+        ]
+
+
 if __name__ == "__main__":
     e = EquidistantPointGenerator()
     print(e.generate(LineSegment(0, 1), 5))
@@ -5,6 +5,7 @@ sys.path.append("../..")
 
 from typing import List
 from tasks.utils.expression_parsing import custom_parse_expr
+from common.calculation.compiled_functions import get_compiled_function
 from common.calculation.root_finding.root_calculator import RootCalculator
 from common.calculation.root_finding.singe_solvers.as_newton_solvers.modified_newton_solver import (
     ModifiedNewtonMethodSolver,
@@ -12,9 +13,9 @@ from common.calculation.root_finding.singe_solvers.as_newton_solvers.modified_ne
 from tasks.utils.plotly import update_figure_to_x_axis
 from common.calculation.root_finding.singe_solvers.as_newton_solvers.newton_solver import NewtonMethodSolver
 from common.calculation.root_finding.singe_solvers.as_newton_solvers.secant_solver import SecantLineSolver
-from common.calculation.root_finding.singe_solvers.bisection_solver import BisectionSolver
+from common.calculation.root_finding.singe_solvers.bisection_solver import BisectionSolver, BatchBisectionSolver
+from common.calculation.root_finding.singe_solvers.brent_solver import BrentSolver
 from common.models.line_segment import LineSegment
-from sympy import lambdify
 import streamlit as st
 from config import COLORS
 import plotly.graph_objects as go
@@ -46,14 +47,14 @@ def display_segments(segments: List[LineSegment]):
 
 
 def display_approximate_values(statistic, function, method_name):
-    values = statistic.values
-    st.markdown(rf"""{LINE_START} The number of steps $m$: $\;$ ${len(values) - 1}$""")
+    values = list(statistic.values)
+    st.markdown(rf"""{LINE_START} The number of steps $m$: $\;$ ${statistic.number_of_iterations}$""")
     st.markdown(rf"""{LINE_START} Initial approximation $x_{0}$: $\;$ ${values[0]}$""")
     if method_name == SecantLineSolver.method_name:
         st.markdown(rf"""{LINE_START} Second initial approximation: $\;$ ${statistic.additional_value}$""")
     st.markdown(rf"""{LINE_START} Final approximation $x_m$: $\;$ ${values[-1]}$""")
 
-    if method_name == BisectionSolver.method_name:
+    if method_name in (BisectionSolver.method_name, BatchBisectionSolver.method_name, BrentSolver.method_name):
         st.markdown(rf"""{LINE_START} The length of the last segment: $\;$ ${statistic.last_segment_length}$""")
     else:
         st.markdown(rf"""{LINE_START} $|x_m - x_{{m-1}}|$: $\;$ ${abs(values[-1] - values[-2])}$""")
@@ -82,18 +83,20 @@ def display_approximate_values(statistic, function, method_name):
 def main():
     solvers = {
         BisectionSolver.method_name: BisectionSolver,
+        BatchBisectionSolver.method_name: BatchBisectionSolver,
         NewtonMethodSolver.method_name: NewtonMethodSolver,
         ModifiedNewtonMethodSolver.method_name: ModifiedNewtonMethodSolver,
         SecantLineSolver.method_name: SecantLineSolver,
+        BrentSolver.method_name: BrentSolver,
     }
 
     st.title("Evaluating the roots")
     expression = st.text_input("Enter expression", "2^(-x)-sin(x)")
     function = custom_parse_expr(expression)
-    func_as_lambda = lambdify("x", function)
+    func_as_lambda = get_compiled_function(function)
 
     solver_name = st.selectbox("Choose what you want to colorize", tuple(solvers))
-    solver = RootCalculator(solvers[solver_name]())
+    solver = RootCalculator(solvers[solver_name](), use_polynomial_root_finder=False)
 
     segment_col1, segment_col2 = st.columns(2)
     left_bound = segment_col1.number_input("Enter line boundaries", step=1.0, value=-5.0)
@@ -114,10 +117,12 @@ def main():
         st.header("Refinement of the solution")
         for i in range(len(result)):
             st.subheader(f"Root {i + 1}")
+            statistic = solver.stat.single_solver_statistics[i]
             if result[i] is None:
-                st.error("Couldn't find a solution :(")
+                stop_reason = statistic.stop_reason.value
+                st.error(f"Couldn't find a solution, the last initial value stopped by {stop_reason} :(")
             else:
-                display_approximate_values(solver.stat.single_solver_statistics[i], func_as_lambda, solver_name)
+                display_approximate_values(statistic, func_as_lambda, solver_name)
 
 
 if __name__ == "__main__":
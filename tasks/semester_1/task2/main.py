@@ -7,9 +7,14 @@ sys.path.append("../..")
 from config import COLORS
 from tasks.utils.plotly import add_line, add_nodes
 from common.calculation.interpolation.interpolators.newton_interpolator import NewtonInterpolator
-from common.models.point_generation import RandomPointGenerator, EquidistantPointGenerator
+from common.models.point_generation import RandomPointGenerator, EquidistantPointGenerator, ChebyshevPointGenerator
 from common.calculation.interpolation.find_optimal_points import find_optimal_points
 from common.calculation.interpolation.interpolators.lagrangian_interpolator import LagrangianInterpolator
+from common.calculation.interpolation.interpolators.barycentric_interpolator import BarycentricInterpolator
+from common.calculation.interpolation.interpolators.chebyshev_interpolator import ChebyshevInterpolator
+from common.calculation.interpolation.interpolators.cubic_spline_interpolator import CubicSplineInterpolator
+from common.calculation.interpolation.interpolators.floater_hormann_interpolator import FloaterHormannInterpolator
+from common.calculation.interpolation.interpolators.neville_interpolator import NevilleInterpolator
 import numpy as np
 import streamlit as st
 import plotly.graph_objects as go
@@ -25,11 +30,28 @@ from tasks.utils.streamlit import (
 
 LINE_START = "$\quad$"
 
-INTERPOLATORS = [LagrangianInterpolator(), NewtonInterpolator()]
+INTERPOLATORS = [
+    LagrangianInterpolator(),
+    NewtonInterpolator(),
+    BarycentricInterpolator(),
+    ChebyshevInterpolator(),
+    CubicSplineInterpolator(),
+    FloaterHormannInterpolator(),
+]
+
+POLYNOMIAL_SYMBOLS = {
+    LagrangianInterpolator.name: "P^{L}_n",
+    NewtonInterpolator.name: "P^{N}_n",
+    BarycentricInterpolator.name: "P^{B}_n",
+    ChebyshevInterpolator.name: "P^{C}_n",
+    CubicSplineInterpolator.name: "S_3",
+    FloaterHormannInterpolator.name: "R^{FH}_n",
+}
 
 POINT_GENERATORS = {
     RandomPointGenerator.name: RandomPointGenerator(),
     EquidistantPointGenerator.name: EquidistantPointGenerator(),
+    ChebyshevPointGenerator.name: ChebyshevPointGenerator(),
 }
 
 
@@ -50,12 +72,23 @@ def display_result(func, x, approximate_value, points, interpolator_name):
     with st.expander("График", expanded=True):
         st.plotly_chart(fig, use_container_width=True)
 
-    polynomial_symbol = "P^{L}_n" if interpolator_name == LagrangianInterpolator.name else "P^{N}_n"
+    polynomial_symbol = POLYNOMIAL_SYMBOLS[interpolator_name]
     st.markdown(rf"""{LINE_START} Интерполяционное значение ${polynomial_symbol}(x) = {approximate_value}$""")
     st.markdown(rf"""{LINE_START} Значение интерполируемой функции $f(x) = {func(x)}$""")
     st.markdown(rf"""{LINE_START} $|{polynomial_symbol}(x) - f(x)| = {abs(approximate_value - func(x))}$""")
 
 
+def display_adaptive_result(func, x, all_points):
+    st.header(NevilleInterpolator.name)
+    tolerance = st.number_input("Введите точность", format="%e", value=1e-12, key=get_new_key(st))
+    result = NevilleInterpolator(tolerance).evaluate(x, (all_points, [func(point) for point in all_points]))
+
+    st.markdown(rf"""{LINE_START} Выбранная степень $n = {result.degree}$""")
+    st.markdown(rf"""{LINE_START} Интерполяционное значение $P_n(x) = {result.value}$""")
+    st.markdown(rf"""{LINE_START} Оценка погрешности $|P_n(x) - P_{{n-1}}(x)| = {result.error_estimate}$""")
+    st.markdown(rf"""{LINE_START} $|P_n(x) - f(x)| = {abs(result.value - func(x))}$""")
+
+
 def main():
     set_initial_key(st)
     if "seed" not in st.session_state:
@@ -97,6 +130,7 @@ def main():
                     optimal_points,
                     interpolator.name,
                 )
+            display_adaptive_result(func, x_node, all_points)
 
 
 if __name__ == "__main__":
@@ -11,9 +11,10 @@ import plotly.graph_objects as go
 from common.models.point_generation import EquidistantPointGenerator
 from common.calculation.interpolation.interpolators.newton_interpolator import NewtonInterpolator
 from common.calculation.interpolation.find_optimal_points import find_optimal_points
+from common.calculation.interpolation.inverse_interpolation import InverseInterpolator
 from common.calculation.interpolation.interpolators.lagrangian_interpolator import LagrangianInterpolator
-from common.calculation.root_finding.root_calculator import RootCalculator
-from common.calculation.root_finding.singe_solvers.as_newton_solvers.secant_solver import SecantLineSolver
+from common.calculation.interpolation.interpolators.barycentric_interpolator import BarycentricInterpolator
+from common.calculation.root_finding.polynomial_root_finder import PolynomialRootFinder
 from tasks.utils.plotly import add_line, add_nodes
 from config import COLORS
 from tasks.utils.streamlit import (
@@ -29,14 +30,11 @@ from tasks.utils.streamlit import (
 
 LINE_START = "$\quad$"
 
-INTERPOLATORS = {LagrangianInterpolator.name: LagrangianInterpolator(), NewtonInterpolator.name: NewtonInterpolator()}
-
-
-def get_polynomial_as_lambda(interpolator, value_table):
-    def polynomial_as_lambda(x):
-        return interpolator.get_approximate_value(x, value_table)
-
-    return polynomial_as_lambda
+INTERPOLATORS = {
+    LagrangianInterpolator.name: LagrangianInterpolator(),
+    NewtonInterpolator.name: NewtonInterpolator(),
+    BarycentricInterpolator.name: BarycentricInterpolator(),
+}
 
 
 def get_add_polynomial(polynomial_as_lambda):
@@ -120,12 +118,17 @@ def make_inverse_interpolate_first_way(function, f_value, all_points, line_segme
         else st.session_state["second_polynomial_degree"]
     )
     if polynomial_degree is not None:
-        double_points = [(function(point), point) for point in all_points]
-        optimal_double_points = sorted(
-            find_optimal_points(f_value, double_points, polynomial_degree + 1, lambda y: y[0]),
-            key=lambda y: y[0],
-        )
-        value_table = tuple(zip(*optimal_double_points))
+        interpolator = INTERPOLATORS[
+            st.selectbox("Выберите представление многочлена", tuple(INTERPOLATORS), key=get_new_key(st))
+        ]
+        try:
+            inverse_interpolator = InverseInterpolator(
+                (all_points, [function(point) for point in all_points]), polynomial_degree + 1, interpolator
+            )
+        except ValueError:
+            st.error("Функция не монотонна в узлах")
+            return
+        value_table = inverse_interpolator.get_value_table(f_value)
 
         display_x_points(
             st,
@@ -138,19 +141,14 @@ def make_inverse_interpolate_first_way(function, f_value, all_points, line_segme
             x_point_name="F",
         )
 
-        interpolator = INTERPOLATORS[
-            st.selectbox("Выберите представление многочлена", tuple(INTERPOLATORS), key=get_new_key(st))
-        ]
-        desired_value = interpolator.get_approximate_value(f_value, value_table)
+        desired_value = inverse_interpolator(f_value)
 
         display_result(
             function,
             points=value_table[1],
             desired_values=[desired_value],
             desired_f_value=f_value,
-            add_graph_function=get_add_inverse_polynomial(
-                function, get_polynomial_as_lambda(interpolator, value_table)
-            ),
+            add_graph_function=get_add_inverse_polynomial(function, inverse_interpolator.get_polynomial(f_value)),
             line_segment=line_segment,
         )
 
@@ -158,7 +156,6 @@ def make_inverse_interpolate_first_way(function, f_value, all_points, line_segme
 def make_inverse_interpolate_second_way(function, f_value, line_segment, all_points):
     display_title(st, "Способ с построением полинома функции", 2)
 
-    solver = RootCalculator(SecantLineSolver())
     polynomial_degree = input_polynomial_degree(
         st, len(all_points) - 1, st.session_state["polynomial_degree"], key=get_new_key(st)
     )
@@ -181,17 +178,11 @@ def make_inverse_interpolate_second_way(function, f_value, line_segment, all_poi
             x_point=f_value,
             x_point_name="F",
         )
-        col_1, col_2 = st.columns((1, 2))
-        accuracy = col_1.number_input("Введите точность", format="%e", value=1e-12)
-        number_of_steps = col_2.number_input(
-            "Введите на сколько частей разобьется отрезок для нахождения корней", value=100, step=1, format="%i"
-        )
-        interpolator = INTERPOLATORS[
-            st.selectbox("Выберите представление многочлена", tuple(INTERPOLATORS), key=get_new_key(st))
-        ]
-        polynomial_as_lambda = get_polynomial_as_lambda(interpolator, value_table)
-        desired_values = solver.find_roots(
-            lambda x: polynomial_as_lambda(x) - f_value, line_segment, accuracy, number_of_steps
+        accuracy = st.number_input("Введите точность", format="%e", value=1e-12)
+        # All roots of the polynomial are found at once by its value table, the segment isn't split.
+        polynomial_as_lambda = BarycentricInterpolator().fit(value_table)
+        desired_values = PolynomialRootFinder().find_roots(
+            (value_table[0], [value - f_value for value in value_table[1]]), line_segment, accuracy
         )
 
         display_result(
@@ -5,12 +5,13 @@ sys.path.append("../../..")
 
 import streamlit as st
 import pandas as pd
-from sympy import lambdify, diff
 import numpy as np
 from plotly.subplots import make_subplots
 
 from config import COLORS
+from common.calculation.compiled_functions import get_compiled_function
 from common.calculation.derivative.derivative_calculator import FirstDerivativeCalculator, SecondDerivativeCalculator
+from common.calculation.derivative.richardson import RichardsonDerivativeEvaluator
 from common.models.line_segment import LineSegment
 from common.models.point_generation import EquidistantPointGenerator
 from tasks.utils.expression_parsing import custom_parse_expr
@@ -95,11 +96,9 @@ def add_line_with_points(
 def display_result(points, sympy_function, first_derivative_values, second_derivatives_values):
     display_title(st, "Результат", 2)
 
-    first_derivative = diff(sympy_function)
-    second_derivative = diff(first_derivative)
-    first_derivative_as_lambda = lambdify("x", first_derivative)
-    second_derivative_as_lambda = lambdify("x", second_derivative)
-    function_as_lambda = lambdify("x", sympy_function)
+    first_derivative_as_lambda = get_compiled_function(sympy_function, derivative_order=1)
+    second_derivative_as_lambda = get_compiled_function(sympy_function, derivative_order=2)
+    function_as_lambda = get_compiled_function(sympy_function)
 
     fig = make_subplots(rows=1, cols=2, subplot_titles=("Первая производная", "Вторая производная"))
     add_line_with_points(
@@ -142,6 +141,17 @@ def display_result(points, sympy_function, first_derivative_values, second_deriv
     )
 
 
+def display_richardson_result(parsed_function, x):
+    display_title(st, "Экстраполяция Ричардсона", 2)
+    for derivative_order, derivative_symbol in ((1, "f'"), (2, "f''")):
+        result = RichardsonDerivativeEvaluator(derivative_order).evaluate(parsed_function, x)
+        exact_value = get_compiled_function(parsed_function, derivative_order=derivative_order)(x)
+        st.markdown(rf"""{LINE_START} ${derivative_symbol}({x}) \approx {result.value}$""")
+        st.markdown(rf"""{LINE_START} Оценка погрешности ${result.error_estimate:e}$, шаг $h = {result.step}$""")
+        st.markdown(rf"""{LINE_START} $|\Delta {derivative_symbol}({x})| = {abs(result.value - exact_value):e}$""")
+        st.markdown(rf"""{LINE_START} Вычислений функции: ${result.number_of_evaluations}$""")
+
+
 def main():
     set_initial_key(st)
     first_derivative_calculator = FirstDerivativeCalculator()
@@ -150,7 +160,8 @@ def main():
     display_title(st, "Нахождение производных таблично-заданной функции по формулам численного дифференцирования")
     display_whitespace(st)
     sympy_function = input_sympy_function(st, "exp(3*x)", key=get_new_key(st))
-    function = lambdify("x", custom_parse_expr(sympy_function))
+    parsed_function = custom_parse_expr(sympy_function)
+    function = get_compiled_function(parsed_function)
 
     col_1, col_2, col_3 = st.columns((4, 4, 3))
     left_value = col_1.number_input("Введите значение начальной точки", step=0.1, value=0.0)
@@ -178,6 +189,10 @@ def main():
         second_derivative_values = second_derivative_calculator.calculate(function_values, inter_node_length)
         display_result(all_points, sympy_function, first_derivative_values, second_derivative_values)
 
+        display_whitespace(st)
+        x = st.number_input("Введите точку для экстраполяции Ричардсона", step=0.1, value=left_value)
+        display_richardson_result(parsed_function, x)
+
 
 if __name__ == "__main__":
     main()
@@ -14,7 +14,8 @@ from common.calculation.integrating.compound_quadrature_formulas import (
     SimpsonFormula,
     ThreeFractionsOfEightFormula,
 )
-from sympy import integrate, lambdify
+from common.calculation.compiled_functions import get_compiled_function
+from sympy import integrate
 import streamlit as st
 from common.models.line_segment import LineSegment
 from tasks.utils.streamlit import (
@@ -43,9 +44,9 @@ QUADRATURES = {
 
 def display_result(line_segment: LineSegment, partition_count, addition_partition_count, sympy_function=None):
     display_title(st, "Результат", 2)
-    function = lambdify("x", sympy_function)
+    function = get_compiled_function(sympy_function)
     try:
-        integral = lambdify("x", integrate(sympy_function))
+        integral = get_compiled_function(integrate(sympy_function))
     except ValueError:  # constant
         integral = lambda x: int(str(sympy_function)) * x
     real_integral_value = integral(line_segment.right) - integral(line_segment.left)
@@ -16,7 +16,8 @@ from common.calculation.integrating.compound_quadrature_formulas import (
     ThreeFractionsOfEightFormula,
 )
 from common.models.point_generation import EquidistantPointGenerator
-from sympy import integrate, lambdify
+from common.calculation.compiled_functions import get_compiled_function
+from sympy import integrate
 import streamlit as st
 from math import cos
 import plotly.graph_objects as go
@@ -218,10 +219,10 @@ def display_result(
 
     if function_name:
         sympy_function = FUNCTIONS[function_name]["sympy"]
-    function = lambdify("x", sympy_function)
+    function = get_compiled_function(sympy_function)
 
     try:
-        integral = lambdify("x", integrate(sympy_function))
+        integral = get_compiled_function(integrate(sympy_function))
     except ValueError:  # constant
         integral = lambda x: int(str(sympy_function)) * x
     real_integral_value = integral(line_segment.right) - integral(line_segment.left)
@@ -1,9 +1,9 @@
 from typing import Tuple
 
-from sympy import lambdify
 import plotly.graph_objects as go
 import pandas as pd
 
+from common.calculation.compiled_functions import get_compiled_function
 from common.models.line_segment import LineSegment
 from common.models.point_generation import EquidistantPointGenerator
 from config import COLORS
@@ -22,7 +22,7 @@ def set_initial_key(st):
 
 def input_function(st, initial_expression: str, key):
     expression = input_sympy_function(st, initial_expression, key)
-    return lambdify("x", custom_parse_expr(expression))
+    return get_compiled_function(custom_parse_expr(expression))
 
 
 def input_sympy_function(st, initial_expression: str, key, message="Введите выражение"):
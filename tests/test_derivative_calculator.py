@@ -0,0 +1,33 @@
+import unittest
+
+import numpy as np
+
+from common.calculation.derivative.derivative_calculator import FiniteDifferenceCalculator
+
+
+class CalculateInChunksTest(unittest.TestCase):
+    def setUp(self):
+        self.step = 1e-2
+        self.values = np.sin(np.arange(1000) * self.step)
+
+    def _assert_same_as_calculate(self, calculator: FiniteDifferenceCalculator, function_values, chunk_size: int):
+        derivatives = np.concatenate(list(calculator.calculate_in_chunks(function_values, self.step, chunk_size)))
+        np.testing.assert_allclose(derivatives, calculator.calculate(self.values, self.step), rtol=0, atol=1e-12)
+
+    def test_generator_of_samples(self):
+        for calculator in (FiniteDifferenceCalculator(1, 4), FiniteDifferenceCalculator(2, 2, with_boundaries=False)):
+            for chunk_size in (1, 7, 64, 5000):
+                self._assert_same_as_calculate(calculator, (float(value) for value in self.values), chunk_size)
+
+    def test_array_and_iterable_of_chunks(self):
+        calculator = FiniteDifferenceCalculator(1, 4)
+        self._assert_same_as_calculate(calculator, self.values, 100)
+        self._assert_same_as_calculate(calculator, iter(np.array_split(self.values, 13)), 100)
+
+    def test_too_few_samples(self):
+        with self.assertRaises(ValueError):
+            list(FiniteDifferenceCalculator(1, 4).calculate_in_chunks(iter([1.0, 2.0]), self.step))
+
+
+if __name__ == "__main__":
+    unittest.main()
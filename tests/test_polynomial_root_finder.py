@@ -0,0 +1,40 @@
+import unittest
+
+import numpy as np
+from sympy import Symbol, chebyshevt, legendre, sympify
+
+from common.calculation.root_finding.polynomial_root_finder import PolynomialRootFinder
+from common.calculation.root_finding.root_calculator import RootCalculator
+from common.calculation.root_finding.singe_solvers.brent_solver import BrentSolver
+from common.models.line_segment import LineSegment
+
+
+class PolynomialRootFinderTest(unittest.TestCase):
+    def test_high_degree_legendre_expression(self):
+        roots = RootCalculator(BrentSolver()).find_roots(legendre(40, Symbol("x")), LineSegment(-1, 1), 1e-10, 4000)
+        expected_roots = np.polynomial.legendre.leggauss(40)[0]
+        self.assertEqual(len(roots), 40)
+        # The expanded form sums terms up to 1e14 in float, so the values and the roots are only that accurate.
+        np.testing.assert_allclose(roots, expected_roots, atol=1e-4)
+
+    def test_high_degree_chebyshev_expression(self):
+        roots = PolynomialRootFinder().find_roots(chebyshevt(30, Symbol("x")), LineSegment(-1, 1), 1e-12)
+        expected_roots = np.sort(np.cos((2 * np.arange(30) + 1) * np.pi / 60))
+        self.assertEqual(len(roots), 30)
+        np.testing.assert_allclose(roots, expected_roots, atol=1e-12)
+
+    def test_complex_pair_close_to_real_axis(self):
+        self.assertEqual(
+            PolynomialRootFinder().find_roots(sympify("(x - 0.5)**2 + 1e-13"), LineSegment(0, 1), 1e-12), []
+        )
+
+    def test_multiple_and_close_roots(self):
+        finder = PolynomialRootFinder()
+        np.testing.assert_allclose(finder.find_roots(sympify("(x - 0.5)**2"), LineSegment(0, 1), 1e-12), [0.5])
+        np.testing.assert_allclose(
+            finder.find_roots(sympify("(x - 0.5)*(x - 0.5 - 1e-7)"), LineSegment(0, 1), 1e-12), [0.5, 0.5 + 1e-7]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,34 @@
+import unittest
+
+import numpy as np
+from sympy import sympify
+
+from common.calculation.root_finding.root_calculator import RootCalculator
+from common.calculation.root_finding.root_separator import AdaptiveRootSeparator
+from common.calculation.root_finding.singe_solvers.brent_solver import BrentSolver
+from common.models.line_segment import LineSegment
+
+
+def find_roots(expression: str, number_of_steps: int = 10):
+    calculator = RootCalculator(BrentSolver(), AdaptiveRootSeparator(), use_polynomial_root_finder=False)
+    return calculator.find_roots(sympify(expression), LineSegment(0, 3), 1e-12, number_of_steps, "t")
+
+
+class AdaptiveRootSeparatorTest(unittest.TestCase):
+    def test_double_root_without_sign_change_gives_no_brackets(self):
+        self.assertEqual(find_roots("(t - 1)**2"), [])
+
+    def test_near_double_roots_are_separated(self):
+        np.testing.assert_allclose(find_roots("(t - 1)**2 - 1e-10"), [1 - 1e-5, 1 + 1e-5], atol=1e-10)
+        np.testing.assert_allclose(find_roots("(t - 1)*(t - 1.0001)*(t + 2)"), [1, 1.0001], atol=1e-10)
+
+    def test_triple_root_is_found_once(self):
+        np.testing.assert_allclose(find_roots("(t - 1)**3"), [1], atol=1e-5)
+
+    def test_zeros_at_nodes_are_found_once(self):
+        np.testing.assert_allclose(find_roots("t*(t - 1.5)"), [0, 1.5], atol=1e-12)
+        np.testing.assert_allclose(find_roots("sin(10*t)"), np.arange(10) * np.pi / 10, atol=1e-10)
+
+
+if __name__ == "__main__":
+    unittest.main()